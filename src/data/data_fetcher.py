@@ -57,6 +57,11 @@ class FutuDataFetcher:
 
             df = pd.DataFrame(data)
 
+            # OpenD returns time_key as strings; parse them once here so the
+            # resampler and the engine receive a datetime64 column
+            if "time_key" in df.columns:
+                df["time_key"] = pd.to_datetime(df["time_key"], cache=True)
+
             # Resample if needed
             if timeframe.upper() in futu_timeframe_map:
                 df = resample_ohlcv(df, timeframe)
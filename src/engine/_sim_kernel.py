@@ -0,0 +1,94 @@
+"""
+Compiled inner loop of the backtest simulation.
+
+The cash/position recurrence is sequential and cannot be vectorized, so
+it is written against plain NumPy arrays and compiled with Numba when
+available. It only visits bars that carry a signal. It is compiled without
+fastmath, which would let LLVM assume the NaN closes of missing bars away.
+"""
+
+import numpy as np
+from src.utils.jit import njit
+
+BUY = 1
+SELL = -1
+
+
+@njit(cache=True)
+def simulate(close, signals, initial_capital, commission, lot_size):
+    """
+    Run the long-only lot-sized simulation over a signal series.
+
+    Args:
+        close: Closing prices (float64); signals on NaN closes are skipped
+        signals: Trading signals (1: Buy, -1: Sell, 0: Hold)
+        initial_capital: Starting cash
+        commission: Commission rate applied to both buys and sells
+        lot_size: Minimum tradable quantity
+
+    Returns:
+        Tuple of per-bar ``position`` and ``cash`` arrays, followed by the
+        executed trades as parallel arrays ``trade_idx``, ``trade_type``
+        (BUY/SELL), ``trade_qty`` and ``trade_price``
+    """
+    n = len(close)
+    position = np.zeros(n, dtype=np.int64)
+    cash = np.full(n, initial_capital, dtype=np.float64)
+
+    # Only bars carrying a signal can change the state; the first bar never
+    # trades. At most one trade per event
+    events = np.flatnonzero(signals[1:]) + 1
+    m = len(events)
+    trade_idx = np.empty(m, dtype=np.int64)
+    trade_type = np.empty(m, dtype=np.int8)
+    trade_qty = np.empty(m, dtype=np.int64)
+    trade_price = np.empty(m, dtype=np.float64)
+    trade_cash = np.empty(m, dtype=np.float64)
+    k = 0
+
+    pos = 0
+    c = initial_capital
+    for i in events:
+        p = close[i]
+        if np.isnan(p):
+            continue  # Missing bar; there is no price to trade at
+
+        if signals[i] == 1 and pos == 0:  # Buy signal
+            max_shares = int(c / (p * (1 + commission)))
+            lots_to_buy = (max_shares // lot_size) * lot_size
+
+            if lots_to_buy >= lot_size:
+                c -= lots_to_buy * p * (1 + commission)
+                pos = lots_to_buy
+                trade_idx[k] = i
+                trade_type[k] = BUY
+                trade_qty[k] = lots_to_buy
+                trade_price[k] = p
+                trade_cash[k] = c
+                k += 1
+
+        elif signals[i] == -1 and pos > 0:  # Sell signal
+            c += pos * p * (1 - commission)
+            trade_idx[k] = i
+            trade_type[k] = SELL
+            trade_qty[k] = pos
+            trade_price[k] = p
+            trade_cash[k] = c
+            k += 1
+            pos = 0
+
+    # Position and cash only change on trade bars; fill each segment up to
+    # the next trade in one slice
+    for j in range(k):
+        stop = trade_idx[j + 1] if j + 1 < k else n
+        position[trade_idx[j] : stop] = trade_qty[j] if trade_type[j] == BUY else 0
+        cash[trade_idx[j] : stop] = trade_cash[j]
+
+    return (
+        position,
+        cash,
+        trade_idx[:k],
+        trade_type[:k],
+        trade_qty[:k],
+        trade_price[:k],
+    )
@@ -1,16 +1,21 @@
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import numpy as np
 import pandas as pd
 from datetime import datetime
+import logging
 from logging import Logger
 from src.strategy.base_strategy import BaseStrategy
 from src.utils.logger import setup_logger
 from .metrics.return_metrics import ReturnMetrics
 from .metrics.risk_metrics import RiskMetrics
-from .metrics.trade_metrics import TradeMetrics
+from .metrics.trade_metrics import TradeMetrics, TradeLog
 from .strategy_backtest_report import StrategyBacktestReport
 from .symbol_results import SymbolResults, BacktestReport
 from .benchmark_portfolio import BenchmarkPortfolio
+from ._sim_kernel import simulate, BUY
 
 
 @dataclass
@@ -27,6 +32,20 @@ class TradeExecution:
     proceeds: Optional[float] = None
 
 
+# Storage dtypes of the simulated portfolio columns. Position stays int64:
+# share counts have no upper cap and would wrap silently above 2**31. Cash
+# and total stay float64 because they feed the final value and total return,
+# which are reported to the cent
+PORTFOLIO_DTYPES = {
+    "position": "int64",
+    "close": "float32",
+    "cash": "float64",
+    "holdings": "float32",
+    "total": "float64",
+    "returns": "float32",
+}
+
+
 class BacktestEngine:
     """
     Backtesting engine for simulating trading strategies.
@@ -42,6 +61,7 @@ class BacktestEngine:
         commission: float = 0.001,
         lot_size: int = 1,
         logger: Optional[Logger] = None,
+        parallel: bool = True,
     ):
         """
         Initialize backtesting engine.
@@ -51,21 +71,32 @@ class BacktestEngine:
             initial_capital: Starting capital for backtest
             commission: Trading commission rate
             logger: Optional custom logger instance
+            parallel: Run multi-symbol backtests in separate processes when
+                more than one symbol and CPU are available. The strategy is
+                pickled to each worker, so it must be picklable
         """
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.commission = commission
         self.portfolio = pd.DataFrame()
         self.trades: List[TradeExecution] = []
+        self.trade_log: Optional[TradeLog] = None
         self.logger = logger or setup_logger(__name__)
         self.lot_size = lot_size
         self.symbol: Optional[str] = None
+        self.parallel = parallel
 
     def run(
         self, data: pd.DataFrame, symbol: str, start_date: datetime, end_date: datetime
     ) -> BacktestReport:
         """Execute backtest for the given data and symbol."""
         self.symbol = symbol
+
+        # Parse time_key once up front; the start banner, prepare_data and
+        # the portfolio index all reuse the parsed column
+        if not pd.api.types.is_datetime64_any_dtype(data["time_key"]):
+            data = data.assign(time_key=pd.to_datetime(data["time_key"], cache=True))
+
         self._log_backtest_start(data, symbol)
 
         # Calculate indicators with warmup period
@@ -76,9 +107,10 @@ class BacktestEngine:
         # Generate signals only on the trading data (post-warmup)
         signals = self.strategy.generate_signals(trading_data)
 
-        # Calculate portfolio metrics excluding warmup period
-        self.portfolio = self._calculate_portfolio(trading_data, signals)
-        self.trades = self._generate_trades_list(trading_data, signals)
+        # Simulate trades and portfolio excluding warmup period
+        self.portfolio, self.trades, self.trade_log = self._simulate(
+            trading_data, signals
+        )
 
         # Calculate comprehensive backtest metrics
         metrics = self._calculate_metrics()
@@ -100,8 +132,11 @@ class BacktestEngine:
 
     def _log_backtest_start(self, data: pd.DataFrame, symbol: str) -> None:
         """Log backtest initialization details"""
-        start_date = pd.to_datetime(data["time_key"].iloc[0]).strftime("%Y-%m-%d")
-        end_date = pd.to_datetime(data["time_key"].iloc[-1]).strftime("%Y-%m-%d")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        start_date = data["time_key"].iloc[0].strftime("%Y-%m-%d")
+        end_date = data["time_key"].iloc[-1].strftime("%Y-%m-%d")
 
         self.logger.info("=" * 50)
         self.logger.info("Backtest Configuration:")
@@ -112,32 +147,34 @@ class BacktestEngine:
         self.logger.info(f"Commission Rate: {self.commission*100:.2f}%")
         self.logger.info("=" * 50)
 
-    def _log_trade_execution(self, trade: Dict[str, Any]) -> None:
+    def _log_trade_execution(self, trade: Dict[str, Any], realized_pnl: float) -> None:
         """Log trade execution details"""
-        trade_type = trade["type"].upper()
         quantity = trade["quantity"]
         lots = quantity // self.lot_size
-        price = trade["price"]
 
-        if trade_type == "BUY":
-            cost = trade["cost"]
-            commission = trade["commission"]
+        if trade["type"] == "buy":
             self.logger.info(
-                f"TRADE: {trade['timestamp']} | {trade_type} | "
-                f"{quantity:,d} units ({lots:,d} lots) @ ${price:.3f} | "
-                f"Cost: ${cost:,.2f} | Commission: ${commission:.2f}"
+                f"[{self.symbol}] Trade executed at {trade['timestamp']}: BUY "
+                f"{quantity} units ({lots} lots) at ${trade['price']:.2f} "
+                f"(Cost: ${trade['cost']:,.2f}, "
+                f"Commission: ${trade['commission']:.2f})"
             )
         else:  # SELL
-            proceeds = trade["proceeds"]
-            pnl = trade["pnl"]
             self.logger.info(
-                f"TRADE: {trade['timestamp']} | {trade_type} | "
-                f"{quantity:,d} units ({lots:,d} lots) @ ${price:.3f} | "
-                f"Proceeds: ${proceeds:,.2f} | PnL: ${pnl:,.2f}"
+                f"[{self.symbol}] Trade executed at {trade['timestamp']}: SELL "
+                f"{quantity} units ({lots} lots) at ${trade['price']:.2f} "
+                f"(Proceeds: ${trade['proceeds']:,.2f}, "
+                f"Commission: ${trade['commission']:.2f})"
+            )
+            self.logger.info(
+                f"Trade PnL: ${trade['pnl']:,.2f} (Running PnL: ${realized_pnl:,.2f})"
             )
 
     def _log_backtest_summary(self, metrics: Dict[str, Any]) -> None:
         """Log final backtest results"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         self.logger.info("\n" + "=" * 50)
         self.logger.info(f"Backtest Summary {self.symbol}:")
         self.logger.info(f"Total Return: {metrics['total_return']*100:.2f}%")
@@ -149,68 +186,135 @@ class BacktestEngine:
         self.logger.info(f"Total PnL: ${metrics['total_pnl']:,.2f}")
         self.logger.info("=" * 50)
 
-    def _calculate_portfolio(
+    def _simulate(
         self, data: pd.DataFrame, signals: pd.Series
-    ) -> pd.DataFrame:
-        """Calculate portfolio value over time with lot size handling"""
-        # Initialize portfolio DataFrame properly
-        portfolio = pd.DataFrame(
-            {
-                "time_key": data["time_key"],
-                "position": 0,
-                "close": pd.to_numeric(data["close"].values),
-                "cash": self.initial_capital,
-            }
-        ).set_index("time_key")
-        portfolio.index = pd.to_datetime(portfolio.index)
-
-        current_position = 0
-        for i in range(1, len(signals)):
-            price = portfolio["close"].iloc[i]
-
-            if signals[i] == 1 and current_position == 0:  # Buy signal
-                max_shares = int(
-                    portfolio["cash"].iloc[i - 1] / (price * (1 + self.commission))
+    ) -> Tuple[pd.DataFrame, List[Dict], TradeLog]:
+        """
+        Simulate trading on signals.
+
+        Returns:
+            Tuple of the portfolio DataFrame, the trades as a list of dicts
+            (used by the reports) and the same trades as a TradeLog of
+            parallel arrays (used by the metrics)
+        """
+        close = data["close"].to_numpy(dtype=np.float64)
+        sig = signals.to_numpy(dtype=np.int64)
+
+        # The sequential cash/position recurrence runs in the compiled kernel
+        position, cash, trade_idx, trade_type, trade_qty, trade_price = simulate(
+            close,
+            sig,
+            float(self.initial_capital),
+            float(self.commission),
+            int(self.lot_size),
+        )
+
+        trades = []
+        log_trades = self.logger.isEnabledFor(logging.INFO)
+        last_buy_price = 0
+        realized_pnl = 0
+        pnls = []
+
+        # Pull the trade bar timestamps in one positional take instead of
+        # a per-trade .iloc lookup; all other loop values are plain scalars
+        trade_times = data["time_key"].iloc[trade_idx]
+        timestamps = trade_times.tolist()
+
+        for timestamp, side, quantity, price in zip(
+            timestamps, trade_type.tolist(), trade_qty.tolist(), trade_price.tolist()
+        ):
+            if side == BUY:
+                cost = quantity * price * (1 + self.commission)
+                last_buy_price = price
+                trade = {
+                    "timestamp": timestamp,
+                    "type": "buy",
+                    "price": price,
+                    "quantity": quantity,
+                    "cost": cost,
+                    "commission": cost - (quantity * price),
+                }
+                pnls.append(np.nan)
+            else:
+                proceeds = quantity * price * (1 - self.commission)
+                trade_pnl = proceeds - (
+                    quantity * last_buy_price * (1 + self.commission)
                 )
-                lots_to_buy = (max_shares // self.lot_size) * self.lot_size
-
-                if lots_to_buy >= self.lot_size:
-                    cost = lots_to_buy * price * (1 + self.commission)
-                    current_position = lots_to_buy
-                    portfolio.loc[portfolio.index[i:], "position"] = lots_to_buy
-                    portfolio.loc[portfolio.index[i], "cash"] = (
-                        portfolio["cash"].iloc[i - 1] - cost
-                    )
-
-            elif signals[i] == -1 and current_position > 0:  # Sell signal
-                proceeds = current_position * price * (1 - self.commission)
-                current_position = 0
-                portfolio.loc[portfolio.index[i:], "position"] = 0
-                portfolio.loc[portfolio.index[i], "cash"] = (
-                    portfolio["cash"].iloc[i - 1] + proceeds
+                realized_pnl += trade_pnl
+                trade = {
+                    "timestamp": timestamp,
+                    "type": "sell",
+                    "price": price,
+                    "quantity": quantity,
+                    "proceeds": proceeds,
+                    "commission": (quantity * price) - proceeds,
+                    "pnl": trade_pnl,
+                }
+                pnls.append(trade_pnl)
+
+            trades.append(trade)
+            if log_trades:
+                self._log_trade_execution(trade, realized_pnl)
+
+        # Calculate floating PnL at the end of backtest period
+        pos = int(position[-1]) if len(position) else 0
+        if log_trades:
+            if pos > 0:
+                floating_pnl = (close[-1] - last_buy_price) * pos
+                self.logger.info(
+                    f"\nEnd of Backtest Summary:"
+                    f"\nRealized PnL: ${realized_pnl:,.2f}"
+                    f"\nFloating PnL: ${floating_pnl:,.2f} "
+                    f"(from {pos} units, {pos // self.lot_size} lots)"
+                    f"\nTotal PnL: ${(realized_pnl + floating_pnl):,.2f}"
                 )
             else:
-                portfolio.loc[portfolio.index[i], "cash"] = portfolio["cash"].iloc[
-                    i - 1
-                ]
-
-        # Use proper forward fill
-        portfolio["cash"] = portfolio["cash"].ffill()
+                self.logger.info(
+                    f"\nEnd of Backtest Summary:"
+                    f"\nRealized PnL: ${realized_pnl:,.2f}"
+                    f"\nNo open positions"
+                )
 
         # Calculate portfolio values
-        portfolio["holdings"] = portfolio["position"] * portfolio["close"]
-        portfolio["total"] = portfolio["cash"] + portfolio["holdings"]
+        holdings = position * close
+        total = cash + holdings
+        returns = np.concatenate(([0.0], np.diff(total) / total[:-1]))
+
+        columns = {
+            "position": position,
+            "close": close,
+            "cash": cash,
+            "holdings": holdings,
+            "total": total,
+            "returns": returns,
+        }
+        # Values are computed in float64 above; prices, holdings and returns
+        # need neither that range nor precision downstream, and the narrower
+        # dtypes halve the bytes every metric pass has to scan. Each array is
+        # cast once and handed to the frame without a further copy
+        portfolio = pd.DataFrame(
+            {
+                name: values.astype(PORTFOLIO_DTYPES[name], copy=False)
+                for name, values in columns.items()
+            },
+            index=pd.DatetimeIndex(data["time_key"], name="time_key"),
+            copy=False,
+        )
 
-        # Calculate returns properly
-        portfolio.loc[:, "returns"] = portfolio["total"].pct_change()
-        portfolio.loc[portfolio.index[0], "returns"] = 0
+        trade_log = TradeLog(
+            pnl=np.asarray(pnls, dtype=np.float64),
+            ts=pd.DatetimeIndex(trade_times).to_numpy(),
+            side=trade_type,
+            qty=trade_qty,
+            price=trade_price,
+        )
 
-        return portfolio
+        return portfolio, trades, trade_log
 
     def _calculate_metrics(self) -> Dict[str, Any]:
         """Calculate comprehensive backtest metrics using metric classes"""
         final_value = self.portfolio["total"].iloc[-1]
-        trades_with_pnl = [t for t in self.trades if t.get("pnl") is not None]
+        closed_trades = self.trade_log.closed()
 
         # Return metrics - calculate total_return first
         total_return = ReturnMetrics.calculate_total_return(
@@ -240,23 +344,23 @@ class BacktestEngine:
 
         # Trade metrics
         trade_metrics = {
-            **TradeMetrics.calculate_trade_counts(trades_with_pnl),
-            "win_rate": TradeMetrics.calculate_win_rate(trades_with_pnl),
-            "profit_factor": TradeMetrics.calculate_profit_factor(trades_with_pnl),
-            **TradeMetrics.calculate_trade_stats(trades_with_pnl),
+            **TradeMetrics.calculate_trade_counts(closed_trades),
+            "win_rate": TradeMetrics.calculate_win_rate(closed_trades),
+            "profit_factor": TradeMetrics.calculate_profit_factor(closed_trades),
+            **TradeMetrics.calculate_trade_stats(closed_trades),
             "max_consecutive_wins": TradeMetrics.calculate_consecutive_stats(
-                trades_with_pnl, "wins"
+                closed_trades, "wins"
             ),
             "max_consecutive_losses": TradeMetrics.calculate_consecutive_stats(
-                trades_with_pnl, "losses"
+                closed_trades, "losses"
             ),
             "avg_position_duration": TradeMetrics.calculate_position_duration(
-                trades_with_pnl
+                closed_trades
             ),
             # Use ReturnMetrics for PnL calculations
-            "realized_pnl": ReturnMetrics.calculate_realized_pnl(trades_with_pnl),
+            "realized_pnl": ReturnMetrics.calculate_realized_pnl(self.trade_log),
             "floating_pnl": ReturnMetrics.calculate_floating_pnl(
-                self.portfolio, trades_with_pnl
+                self.portfolio, self.trade_log
             ),
         }
 
@@ -285,128 +389,102 @@ class BacktestEngine:
             **position_metrics,
         }
 
-    def _generate_trades_list(
-        self, data: pd.DataFrame, signals: pd.Series
-    ) -> List[Dict]:
-        """Generate list of trades from signals with lot size handling"""
-        trades = []
-        current_position = 0
-        last_buy_price = 0
-        realized_pnl = 0
-
-        for i in range(1, len(signals)):
-            if signals[i] == 1 and current_position == 0:  # Buy signal
-                price = data["close"].iloc[i]
-                timestamp = data["time_key"].iloc[i]
-
-                # Calculate lots to buy based on available cash
-                max_shares = int(
-                    self.portfolio["cash"].iloc[i - 1] / (price * (1 + self.commission))
-                )
-                lots_to_buy = (max_shares // self.lot_size) * self.lot_size
-
-                if lots_to_buy >= self.lot_size:
-                    cost = lots_to_buy * price * (1 + self.commission)
-                    trade = {
-                        "timestamp": timestamp,
-                        "type": "buy",
-                        "price": price,
-                        "quantity": lots_to_buy,
-                        "cost": cost,
-                        "commission": cost - (lots_to_buy * price),
-                    }
-                    trades.append(trade)
-                    current_position = lots_to_buy
-                    last_buy_price = price
-
-                    self.logger.info(
-                        f"[{self.symbol}] Trade executed at {timestamp}: BUY "
-                        f"{lots_to_buy} units ({lots_to_buy//self.lot_size} lots) at ${price:.2f} "
-                        f"(Cost: ${cost:,.2f}, Commission: ${cost - (lots_to_buy * price):.2f})"
-                    )
-
-            elif signals[i] == -1 and current_position > 0:  # Sell signal
-                price = data["close"].iloc[i]
-                timestamp = data["time_key"].iloc[i]
-                proceeds = current_position * price * (1 - self.commission)
-                trade_pnl = proceeds - (
-                    current_position * last_buy_price * (1 + self.commission)
-                )
-                realized_pnl += trade_pnl
-
-                trade = {
-                    "timestamp": timestamp,
-                    "type": "sell",
-                    "price": price,
-                    "quantity": current_position,
-                    "proceeds": proceeds,
-                    "commission": (current_position * price) - proceeds,
-                    "pnl": trade_pnl,
-                }
-                trades.append(trade)
-
-                self.logger.info(
-                    f"[{self.symbol}] Trade executed at {timestamp}: SELL "
-                    f"{current_position} units ({current_position//self.lot_size} lots) at ${price:.2f} "
-                    f"(Proceeds: ${proceeds:,.2f}, Commission: ${(current_position * price) - proceeds:.2f})"
-                )
-                self.logger.info(
-                    f"Trade PnL: ${trade_pnl:,.2f} (Running PnL: ${realized_pnl:,.2f})"
-                )
-
-                current_position = 0
-
-        # Calculate floating PnL at the end of backtest period
-        if current_position > 0:
-            final_price = data["close"].iloc[-1]
-            floating_pnl = (final_price - last_buy_price) * current_position
-            self.logger.info(
-                f"\nEnd of Backtest Summary:"
-                f"\nRealized PnL: ${realized_pnl:,.2f}"
-                f"\nFloating PnL: ${floating_pnl:,.2f} (from {current_position} units, {current_position//self.lot_size} lots)"
-                f"\nTotal PnL: ${(realized_pnl + floating_pnl):,.2f}"
-            )
-        else:
-            self.logger.info(
-                f"\nEnd of Backtest Summary:"
-                f"\nRealized PnL: ${realized_pnl:,.2f}"
-                f"\nNo open positions"
-            )
-
-        return trades
-
     def run_multi_symbol(
         self,
         data_dict: Dict[str, pd.DataFrame],
         start_date: datetime,
         end_date: datetime,
+        lot_sizes: Optional[Dict[str, int]] = None,
     ) -> StrategyBacktestReport:
         """
         Execute backtest for multiple symbols.
 
         Args:
             data_dict: Dictionary mapping symbols to their historical data
+            lot_sizes: Optional per-symbol lot sizes; symbols not listed use
+                the engine's lot_size
 
         Returns:
             MultiSymbolBacktestReport: Consolidated report for all symbols
         """
         symbol_results = {}
+        lot_sizes = lot_sizes or {}
+        max_workers = min(len(data_dict), os.cpu_count() or 1)
+
+        if self.parallel and max_workers > 1:
+            # Per-symbol simulations share no state, so fan them out across
+            # processes. The strategy instance is pickled to the workers, so
+            # attributes set after construction carry over as in serial runs
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(
+                        _run_one,
+                        symbol,
+                        data,
+                        start_date,
+                        end_date,
+                        self.strategy,
+                        self.initial_capital,
+                        self.commission,
+                        lot_sizes.get(symbol, self.lot_size),
+                        self.logger,
+                    ): symbol
+                    for symbol, data in data_dict.items()
+                }
+                for future in as_completed(futures):
+                    symbol_results[futures[future]] = future.result()
 
-        for symbol, data in data_dict.items():
-            # Run individual backtest for each symbol
-            report = self.run(data, symbol, start_date, end_date)
-            symbol_results[symbol] = SymbolResults.from_backtest_report(report)
+            # Keep the caller's symbol order regardless of completion order
+            symbol_results = {symbol: symbol_results[symbol] for symbol in data_dict}
+        else:
+            default_lot_size = self.lot_size
+            try:
+                for symbol, data in data_dict.items():
+                    # Run individual backtest for each symbol
+                    self.lot_size = lot_sizes.get(symbol, default_lot_size)
+                    report = self.run(data, symbol, start_date, end_date)
+                    symbol_results[symbol] = SymbolResults.from_backtest_report(report)
+            finally:
+                self.lot_size = default_lot_size
+
+        # Report period spans the earliest to the latest bar of any symbol;
+        # the raw frames are indexed by row number, so read time_key
+        first_bars, last_bars = [], []
+        for data in data_dict.values():
+            time_key = data["time_key"]
+            first_bars.append(pd.Timestamp(time_key.iloc[0]))
+            last_bars.append(pd.Timestamp(time_key.iloc[-1]))
 
         # Create multi-symbol report
         return StrategyBacktestReport(
             strategy_name=self.strategy.__class__.__name__,
-            start_date=pd.to_datetime(
-                min(data.index.min() for data in data_dict.values())
-            ),
-            end_date=pd.to_datetime(
-                max(data.index.max() for data in data_dict.values())
-            ),
+            start_date=min(first_bars),
+            end_date=max(last_bars),
             initial_capital=self.initial_capital,
             commission_rate=self.commission,
             symbol_results=symbol_results,
         )
+
+
+def _run_one(
+    symbol: str,
+    data: pd.DataFrame,
+    start_date: datetime,
+    end_date: datetime,
+    strategy: BaseStrategy,
+    initial_capital: float,
+    commission: float,
+    lot_size: int,
+    logger: Optional[Logger] = None,
+) -> SymbolResults:
+    """Run a single-symbol backtest in a worker process"""
+    engine = BacktestEngine(
+        strategy=strategy,
+        initial_capital=initial_capital,
+        commission=commission,
+        lot_size=lot_size,
+        logger=logger,
+        parallel=False,
+    )
+    report = engine.run(data, symbol, start_date, end_date)
+    return SymbolResults.from_backtest_report(report)
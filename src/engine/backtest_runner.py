@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Optional, List
@@ -9,6 +10,9 @@ from ..strategy.strategy_factory import StrategyFactory
 from .backtest_engine import BacktestEngine
 from ..utils.logger import setup_logger
 
+# Upper bound on concurrent OpenD requests while fetching symbols
+MAX_FETCH_WORKERS = 16
+
 
 @dataclass
 class BacktestConfig:
@@ -65,29 +69,45 @@ class BacktestRunner:
 
         warmup_periods = strategy.get_required_warmup_period()
 
-        # Fetch data for all symbols in parallel
+        # Fetch data and lot sizes for all symbols in parallel; the requests
+        # are I/O bound against OpenD so threads are sufficient
         data_dict = {}
-        for symbol in config.symbols:
-            data_dict[symbol] = self.data_fetcher.fetch_data(
-                symbol=symbol,
-                start_date=config.start_date,
-                end_date=config.end_date,
-                timeframe=config.timeframe,
-                warmup_periods=warmup_periods,
-            )
-
-        # Fetch lot size and fundamental data
-        lot_size = self.data_fetcher.fetch_lot_size(symbol)
+        lot_sizes = {}
+        max_workers = min(MAX_FETCH_WORKERS, len(config.symbols)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            data_futures = {
+                executor.submit(
+                    self.data_fetcher.fetch_data,
+                    symbol=symbol,
+                    start_date=config.start_date,
+                    end_date=config.end_date,
+                    timeframe=config.timeframe,
+                    warmup_periods=warmup_periods,
+                ): symbol
+                for symbol in config.symbols
+            }
+            lot_futures = {
+                executor.submit(self.data_fetcher.fetch_lot_size, symbol): symbol
+                for symbol in config.symbols
+            }
+            for future in as_completed(data_futures):
+                data_dict[data_futures[future]] = future.result()
+            for future in as_completed(lot_futures):
+                lot_sizes[lot_futures[future]] = future.result()
+
+        # Keep the configured symbol order regardless of completion order
+        data_dict = {symbol: data_dict[symbol] for symbol in config.symbols}
 
         # Initialize and run backtest engine
         engine = BacktestEngine(
             strategy=strategy,
             initial_capital=config.initial_capital,
             commission=config.commission,
-            lot_size=lot_size,
         )
 
-        results = engine.run_multi_symbol(data_dict, config.start_date, config.end_date)
+        results = engine.run_multi_symbol(
+            data_dict, config.start_date, config.end_date, lot_sizes=lot_sizes
+        )
 
         # Generate report
         output_dir = os.path.join(os.getcwd(), "reports")
@@ -1,6 +1,6 @@
-from typing import Dict, List, Any
 import pandas as pd
 import numpy as np
+from .trade_metrics import TradeLog
 
 
 class ReturnMetrics:
@@ -24,9 +24,12 @@ class ReturnMetrics:
         portfolio: pd.DataFrame, risk_free_rate: float = 0.02
     ) -> float:
         """Calculate Sharpe ratio"""
-        returns = portfolio["returns"]
-        excess_returns = returns - risk_free_rate / 252
-        volatility = returns.std() * np.sqrt(252)
+        # Accumulate in float64 regardless of the column's storage dtype
+        excess_returns = (
+            portfolio["returns"].to_numpy(dtype=np.float64) - risk_free_rate / 252
+        )
+        # Shifting by a constant leaves the standard deviation unchanged
+        volatility = excess_returns.std(ddof=1) * np.sqrt(252)
         return (excess_returns.mean() * 252) / volatility if volatility != 0 else 0
 
     @staticmethod
@@ -48,22 +51,20 @@ class ReturnMetrics:
         return pd.DataFrame({"returns": monthly_returns})
 
     @staticmethod
-    def calculate_realized_pnl(trades: List[Dict[str, Any]]) -> float:
+    def calculate_realized_pnl(trades: TradeLog) -> float:
         """Calculate realized PnL from trades"""
-        return sum(t.get("pnl", 0) for t in trades if "pnl" in t)
+        return float(np.nansum(trades.pnl))
 
     @staticmethod
-    def calculate_floating_pnl(
-        portfolio: pd.DataFrame, trades: List[Dict[str, Any]]
-    ) -> float:
+    def calculate_floating_pnl(portfolio: pd.DataFrame, trades: TradeLog) -> float:
         """Calculate floating PnL for current position"""
         current_position = portfolio["position"].iloc[-1]
         if current_position <= 0:
             return 0.0
 
-        last_buy_trade = next((t for t in reversed(trades) if t["type"] == "buy"), None)
-        if not last_buy_trade:
+        buys = np.flatnonzero(trades.side > 0)
+        if not buys.size:
             return 0.0
 
         current_price = portfolio["close"].iloc[-1]
-        return (current_price - last_buy_trade["price"]) * current_position
+        return float((current_price - trades.price[buys[-1]]) * current_position)
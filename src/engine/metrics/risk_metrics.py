@@ -8,6 +8,13 @@ class RiskMetrics:
     Handles all risk-related metric calculations for the backtest report.
     """
 
+    @staticmethod
+    def _drawdown_values(portfolio: pd.DataFrame) -> np.ndarray:
+        """Drawdown of cumulative returns from the running peak, as an array"""
+        cumulative_returns = np.cumprod(1 + portfolio["returns"].to_numpy())
+        rolling_max = np.maximum.accumulate(cumulative_returns)
+        return cumulative_returns / rolling_max - 1
+
     @staticmethod
     def calculate_sortino_ratio(
         portfolio: pd.DataFrame, risk_free_rate: float = 0.02
@@ -25,9 +32,9 @@ class RiskMetrics:
     @staticmethod
     def calculate_drawdown_duration(portfolio: pd.DataFrame) -> int:
         """Calculate maximum drawdown duration in days"""
-        cumulative_returns = (1 + portfolio["returns"]).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
-        drawdowns = cumulative_returns / rolling_max - 1
+        drawdowns = pd.Series(
+            RiskMetrics._drawdown_values(portfolio), index=portfolio.index
+        )
 
         is_drawdown = drawdowns < 0
         drawdown_periods = pd.Series(range(len(drawdowns)), index=drawdowns.index)
@@ -65,19 +72,14 @@ class RiskMetrics:
     @staticmethod
     def calculate_drawdowns(portfolio: pd.DataFrame) -> pd.Series:
         """Calculate drawdown series for plotting"""
-        cumulative_returns = (1 + portfolio["returns"]).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
-        return cumulative_returns / rolling_max - 1
+        return pd.Series(RiskMetrics._drawdown_values(portfolio), index=portfolio.index)
 
     @staticmethod
     def calculate_volatility(portfolio: pd.DataFrame) -> float:
         """Calculate annualized volatility"""
-        return portfolio["returns"].std() * np.sqrt(252)
+        return portfolio["returns"].astype(np.float64).std() * np.sqrt(252)
 
     @staticmethod
     def calculate_max_drawdown(portfolio: pd.DataFrame) -> float:
         """Calculate maximum drawdown percentage"""
-        cumulative_returns = (1 + portfolio["returns"]).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
-        drawdowns = cumulative_returns / rolling_max - 1
-        return drawdowns.min()
+        return float(RiskMetrics._drawdown_values(portfolio).min())
@@ -1,30 +1,64 @@
-from typing import List, Dict, Any
-import pandas as pd
+from dataclasses import dataclass
+from typing import Dict
 import numpy as np
 
 
+@dataclass
+class TradeLog:
+    """
+    Executed trades stored as parallel arrays (one element per trade).
+
+    Attributes:
+        pnl (np.ndarray): Realized PnL of each trade (NaN for entries)
+        ts (np.ndarray): Execution timestamps as datetime64
+        side (np.ndarray): Trade side (1: Buy, -1: Sell)
+        qty (np.ndarray): Executed quantity
+        price (np.ndarray): Execution price
+    """
+
+    pnl: np.ndarray
+    ts: np.ndarray
+    side: np.ndarray
+    qty: np.ndarray
+    price: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    def closed(self) -> "TradeLog":
+        """Return only the trades that realized a PnL"""
+        mask = ~np.isnan(self.pnl)
+        return TradeLog(
+            pnl=self.pnl[mask],
+            ts=self.ts[mask],
+            side=self.side[mask],
+            qty=self.qty[mask],
+            price=self.price[mask],
+        )
+
+
 class TradeMetrics:
     """
     Handles all trade-related metric calculations for the backtest report.
     """
 
     @staticmethod
-    def calculate_profit_factor(trades: List[Dict[str, Any]]) -> float:
+    def calculate_profit_factor(trades: TradeLog) -> float:
         """Calculate profit factor (gross profits / gross losses)"""
-        profits = sum(t["pnl"] for t in trades if t.get("pnl", 0) > 0)
-        losses = abs(sum(t["pnl"] for t in trades if t.get("pnl", 0) < 0))
+        pnls = trades.pnl
+        profits = float(pnls[pnls > 0].sum())
+        losses = float(-pnls[pnls < 0].sum())
         return profits / losses if losses != 0 else float("inf")
 
     @staticmethod
-    def calculate_win_rate(trades: List[Dict[str, Any]]) -> float:
+    def calculate_win_rate(trades: TradeLog) -> float:
         """Calculate win rate from trades"""
         if not trades:
             return 0.0
-        winning_trades = len([t for t in trades if t.get("pnl", 0) > 0])
-        return winning_trades / len(trades)
+        return float((trades.pnl > 0).mean())
 
     @staticmethod
-    def calculate_trade_stats(trades: List[Dict[str, Any]]) -> Dict[str, float]:
+    def calculate_trade_stats(trades: TradeLog) -> Dict[str, float]:
         """Calculate comprehensive trade statistics"""
         if not trades:
             return {
@@ -35,61 +69,55 @@ class TradeMetrics:
                 "largest_loss": 0.0,
             }
 
-        pnls = [t.get("pnl", 0) for t in trades]
-        winning_trades = [p for p in pnls if p > 0]
-        losing_trades = [p for p in pnls if p < 0]
+        pnls = trades.pnl
+        winning_trades = pnls[pnls > 0]
+        losing_trades = pnls[pnls < 0]
 
         return {
-            "avg_trade_return": np.mean(pnls) if pnls else 0.0,
-            "avg_win": np.mean(winning_trades) if winning_trades else 0.0,
-            "avg_loss": np.mean(losing_trades) if losing_trades else 0.0,
-            "largest_win": max(pnls) if pnls else 0.0,
-            "largest_loss": min(pnls) if pnls else 0.0,
+            "avg_trade_return": float(pnls.mean()),
+            "avg_win": float(winning_trades.mean()) if winning_trades.size else 0.0,
+            "avg_loss": float(losing_trades.mean()) if losing_trades.size else 0.0,
+            "largest_win": float(pnls.max()),
+            "largest_loss": float(pnls.min()),
         }
 
     @staticmethod
-    def calculate_consecutive_stats(
-        trades: List[Dict[str, Any]], stat_type: str
-    ) -> int:
+    def calculate_consecutive_stats(trades: TradeLog, stat_type: str) -> int:
         """Calculate maximum consecutive wins or losses"""
         if not trades:
             return 0
 
-        current_streak = max_streak = 0
-        for trade in trades:
-            pnl = trade.get("pnl", 0)
-            if (stat_type == "wins" and pnl > 0) or (stat_type == "losses" and pnl < 0):
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 0
-        return max_streak
+        streak = trades.pnl > 0 if stat_type == "wins" else trades.pnl < 0
+        if not streak.any():
+            return 0
+
+        # Run boundaries are where the padded mask flips; runs start on the
+        # even-numbered edges and end on the odd-numbered ones
+        edges = np.flatnonzero(
+            np.diff(np.concatenate(([0], streak.astype(np.int8), [0])))
+        )
+        return int((edges[1::2] - edges[::2]).max())
 
     @staticmethod
-    def calculate_position_duration(trades: List[Dict[str, Any]]) -> float:
+    def calculate_position_duration(trades: TradeLog) -> float:
         """Calculate average position duration in days"""
-        if not trades:
+        pairs = len(trades) // 2
+        if pairs == 0:
             return 0.0
 
-        durations = []
-        for i in range(0, len(trades) - 1, 2):
-            if i + 1 < len(trades):
-                entry = pd.Timestamp(trades[i]["timestamp"])
-                exit = pd.Timestamp(trades[i + 1]["timestamp"])
-                duration = (exit - entry).total_seconds() / (
-                    24 * 3600
-                )  # Convert to days
-                durations.append(duration)
-        return float(np.mean(durations) if durations else 0.0)
+        entries = trades.ts[0 : 2 * pairs : 2]
+        exits = trades.ts[1 : 2 * pairs : 2]
+        durations = (exits - entries) / np.timedelta64(1, "D")  # Convert to days
+        return float(durations.mean())
 
     @staticmethod
-    def calculate_trade_counts(trades: List[Dict[str, Any]]) -> Dict[str, int]:
+    def calculate_trade_counts(trades: TradeLog) -> Dict[str, int]:
         """Calculate basic trade count statistics"""
         if not trades:
             return {"total_trades": 0, "winning_trades": 0, "losing_trades": 0}
 
         return {
             "total_trades": len(trades),
-            "winning_trades": sum(1 for t in trades if t.get("pnl", 0) > 0),
-            "losing_trades": sum(1 for t in trades if t.get("pnl", 0) < 0),
+            "winning_trades": int((trades.pnl > 0).sum()),
+            "losing_trades": int((trades.pnl < 0).sum()),
         }
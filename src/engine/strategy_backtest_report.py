@@ -1,13 +1,145 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
-from jinja2 import Template
+from jinja2 import Environment
+from ..utils.fast_json import dumps
+from ..utils.jit import njit, NUMBA_AVAILABLE
 from .symbol_results import SymbolResults
 import logging
 
+# The template's tojson filter encodes every chart series; route it through
+# orjson when available
+_template_env = Environment()
+_template_env.policies["json.dumps_function"] = dumps
+
+# Upper bound on points per chart series; Highcharts cannot show more on
+# screen and every extra point is serialized into the HTML
+MAX_CHART_POINTS = 4000
+
+
+def _sample_positions(
+    length: int, max_points: int = MAX_CHART_POINTS
+) -> Optional[np.ndarray]:
+    """
+    Positions of every n-th point so at most ~max_points remain.
+
+    The last point is always kept; None means the series is short enough to
+    keep whole.
+    """
+    step = max(1, -(-length // max_points))
+    if step == 1:
+        return None
+    positions = np.arange(0, length, step)
+    if positions[-1] != length - 1:
+        positions = np.append(positions, length - 1)
+    return positions
+
+
+def _downsample(series: pd.Series, max_points: int = MAX_CHART_POINTS) -> pd.Series:
+    """Take every n-th point so at most ~max_points remain, keeping the last"""
+    positions = _sample_positions(len(series), max_points)
+    return series if positions is None else series.iloc[positions]
+
+
+def _epoch_ms(index: pd.Index) -> np.ndarray:
+    """Convert a datetime index to epoch milliseconds in one array operation"""
+    # Cast through datetime64[ms] so any stored resolution (ns, us, s) works
+    values = pd.DatetimeIndex(index).values
+    return values.astype("datetime64[ms]").astype(np.int64)
+
+
+def _to_points(timestamps: np.ndarray, values) -> List[List]:
+    """Pair epoch-ms timestamps with values as [[ts, value], ...] chart points"""
+    return [
+        [t, v]
+        for t, v in zip(
+            timestamps.tolist(), np.asarray(values, dtype=np.float64).tolist()
+        )
+    ]
+
+
+# Strips the unit and grouping characters from formatted metric strings
+_NUM_STRIP = str.maketrans("", "", "%$,")
+
+
+def _raw_value(metric: Dict) -> float:
+    """
+    Numeric value of a metric entry.
+
+    Uses the unformatted "raw" number when present and otherwise parses the
+    formatted "value" ("12.34%", "$1,234.00", "1.05").
+    """
+    if "raw" in metric:
+        return float(metric["raw"])
+    return float(metric["value"].translate(_NUM_STRIP))
+
+
+def _metric_value(results: SymbolResults, group: str, index: int, name: str) -> float:
+    """Numeric value of a symbol's metric, NaN if unavailable"""
+    try:
+        return _raw_value(results.metrics[group][index])
+    except (ValueError, KeyError, IndexError) as e:
+        logging.warning(f"Error processing {name}: {e}")
+        return np.nan
+
+
+def _nan_reduce(func, values: np.ndarray) -> float:
+    """Apply a NaN-ignoring reduction, returning 0 when no value is valid"""
+    if np.isnan(values).all():
+        return 0
+    return func(values)
+
+
+@njit(cache=True)
+def _rolling_corr(values, window, min_periods):
+    """
+    Pearson correlation matrices of K series over a sliding window.
+
+    Keeps the count, the per-symbol sums and the pairwise sums of products
+    (whose diagonal holds the sums of squares), so adding the entering and
+    dropping the leaving observation costs O(K^2) per bar instead of a pass
+    over the whole window. Rows with fewer than min_periods observations and
+    pairs involving a constant series are NaN.
+    """
+    n, k = values.shape
+    out = np.full((n, k, k), np.nan)
+    sum_x = np.zeros(k)
+    sum_xy = np.zeros((k, k))
+    var = np.empty(k)
+    count = 0
+
+    for t in range(n):
+        for a in range(k):
+            sum_x[a] += values[t, a]
+            for b in range(k):
+                sum_xy[a, b] += values[t, a] * values[t, b]
+        count += 1
+        if t >= window:
+            for a in range(k):
+                sum_x[a] -= values[t - window, a]
+                for b in range(k):
+                    sum_xy[a, b] -= values[t - window, a] * values[t - window, b]
+            count -= 1
+        if count < min_periods:
+            continue
+
+        # c = (n*Sxy - Sx*Sy) / sqrt((n*Sxx - Sx^2) * (n*Syy - Sy^2))
+        for a in range(k):
+            # Clamp rounding drift below zero
+            var[a] = max(count * sum_xy[a, a] - sum_x[a] * sum_x[a], 0.0)
+        for a in range(k):
+            for b in range(k):
+                denom = np.sqrt(var[a] * var[b])
+                if denom > 0:
+                    c = (count * sum_xy[a, b] - sum_x[a] * sum_x[b]) / denom
+                    out[t, a, b] = min(max(c, -1.0), 1.0)
+
+    return out
+
 
 @dataclass
 class StrategyBacktestReport:
@@ -20,50 +152,63 @@ class StrategyBacktestReport:
     commission_rate: float
     symbol_results: Dict[str, SymbolResults]
 
+    # Correlation matrices keyed by (method, min_periods); both the portfolio
+    # metrics and the heatmap data request the same matrix
+    _correlation_cache: Dict[Tuple[str, int], pd.DataFrame] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Symbol equity curves aligned into one frame, built on first use
+    _equity_df: Optional[pd.DataFrame] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _equity_curves(self) -> pd.DataFrame:
+        """Equity curves of all symbols as columns of one aligned DataFrame"""
+        if self._equity_df is None:
+            self._equity_df = pd.DataFrame(
+                {
+                    symbol: results.equity_curve
+                    for symbol, results in self.symbol_results.items()
+                }
+            )
+        return self._equity_df
+
+    def _log_returns(self) -> pd.DataFrame:
+        """Log returns of every symbol on the dates where all are defined"""
+        equity_curves = self._equity_curves()
+
+        # Calculate log returns as differences of log equity in one pass;
+        # float32 is ample for correlations reported to two decimals and the
+        # correlation sums accumulate in float64 regardless
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_equity = np.log(equity_curves.to_numpy(dtype=np.float32))
+        return pd.DataFrame(
+            np.diff(log_equity, axis=0),
+            index=equity_curves.index[1:],
+            columns=equity_curves.columns,
+        ).dropna()
+
     def _calculate_portfolio_metrics(self) -> Dict[str, float]:
         """Calculate aggregated portfolio metrics"""
-        # Convert total returns from percentage strings to floats
-        total_returns = []
-        for results in self.symbol_results.values():
-            try:
-                # Extract total return value and convert from percentage string
-                return_str = results.metrics["Performance Metrics"][1]["value"].strip(
-                    "%"
-                )  # Using Total Return metric
-                total_return = float(return_str) / 100  # Convert percentage to decimal
-                total_returns.append(total_return)
-            except (ValueError, KeyError, IndexError) as e:
-                logging.warning(f"Error processing total return: {e}")
-                continue
-
-        # Calculate Sharpe ratios
-        sharpe_ratios = []
-        for results in self.symbol_results.values():
-            try:
-                sharpe_str = results.metrics["Performance Metrics"][3][
-                    "value"
-                ]  # Using Sharpe Ratio metric
-                sharpe_ratios.append(float(sharpe_str))
-            except (ValueError, KeyError, IndexError) as e:
-                logging.warning(f"Error processing Sharpe ratio: {e}")
-                continue
-
-        # Calculate drawdowns
-        drawdowns = []
-        for results in self.symbol_results.values():
-            try:
-                drawdown_str = results.metrics["Risk Metrics"][0]["value"].strip(
-                    "%"
-                )  # Using Max Drawdown metric
-                drawdowns.append(float(drawdown_str))
-            except (ValueError, KeyError, IndexError) as e:
-                logging.warning(f"Error processing drawdown: {e}")
-                continue
+        # Parse the total return, Sharpe ratio and max drawdown of every
+        # symbol in one pass; unparsable values become NaN and are skipped
+        n = len(self.symbol_results)
+        parsed = [
+            (
+                _metric_value(results, "Performance Metrics", 1, "total return"),
+                _metric_value(results, "Performance Metrics", 3, "Sharpe ratio"),
+                _metric_value(results, "Risk Metrics", 0, "drawdown"),
+            )
+            for results in self.symbol_results.values()
+        ]
+        total_returns = np.fromiter((p[0] for p in parsed), dtype=np.float64, count=n)
+        sharpe_ratios = np.fromiter((p[1] for p in parsed), dtype=np.float64, count=n)
+        drawdowns = np.fromiter((p[2] for p in parsed), dtype=np.float64, count=n)
 
-        # Calculate portfolio-level metrics
-        avg_total_return = np.mean(total_returns) if total_returns else 0
-        avg_sharpe_ratio = np.mean(sharpe_ratios) if sharpe_ratios else 0
-        max_drawdown = min(drawdowns) if drawdowns else 0
+        # Calculate portfolio-level metrics (percentages converted to decimal)
+        avg_total_return = _nan_reduce(np.nanmean, total_returns / 100)
+        avg_sharpe_ratio = _nan_reduce(np.nanmean, sharpe_ratios)
+        max_drawdown = _nan_reduce(np.nanmin, drawdowns)
 
         return {
             "total_return": avg_total_return * 100,  # Convert back to percentage
@@ -84,26 +229,43 @@ class StrategyBacktestReport:
         Returns:
             DataFrame containing the correlation matrix
         """
-        try:
-            # Create DataFrame with equity curves for all symbols
-            equity_curves = pd.DataFrame(
-                {
-                    symbol: results.equity_curve
-                    for symbol, results in self.symbol_results.items()
-                }
+        # A single symbol is trivially perfectly correlated with itself
+        if len(self.symbol_results) <= 1:
+            symbols = list(self.symbol_results)
+            return pd.DataFrame(
+                [[1.0]] if symbols else [], index=symbols, columns=symbols
             )
 
-            # Calculate log returns
-            log_returns = np.log(equity_curves / equity_curves.shift(1)).dropna()
+        key = (method, min_periods)
+        if key in self._correlation_cache:
+            return self._correlation_cache[key]
 
-            # Calculate correlation matrix with minimum periods requirement
-            correlation_matrix = log_returns.corr(
-                method=method, min_periods=min_periods
-            )
+        try:
+            log_returns = self._log_returns()
+
+            # Dense Pearson case goes straight to np.corrcoef; everything else
+            # uses pandas' NaN-aware pairwise path with minimum periods
+            values = log_returns.to_numpy()
+            if (
+                method == "pearson"
+                and len(values) >= min_periods
+                and np.isfinite(values).all()
+            ):
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    correlation_matrix = pd.DataFrame(
+                        np.atleast_2d(np.corrcoef(values, rowvar=False)),
+                        index=log_returns.columns,
+                        columns=log_returns.columns,
+                    )
+            else:
+                correlation_matrix = log_returns.corr(
+                    method=method, min_periods=min_periods
+                )
 
             # Replace any remaining NaN values with 0
             correlation_matrix = correlation_matrix.fillna(0)
 
+            self._correlation_cache[key] = correlation_matrix
             return correlation_matrix
 
         except Exception as e:
@@ -112,67 +274,242 @@ class StrategyBacktestReport:
             symbols = list(self.symbol_results.keys())
             return pd.DataFrame(0, index=symbols, columns=symbols)
 
+    def rolling_correlation(
+        self, window: int, min_periods: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Calculate correlation matrices between symbols over a sliding window
+
+        The window advances one bar at a time and, when Numba is available,
+        a compiled kernel updates running sums with the entering and leaving
+        log returns, so the cost is O(T*K^2) rather than recomputing every
+        window from scratch. Without Numba it uses pandas' rolling ``corr``.
+
+        Args:
+            window: Number of log-return observations in each window
+            min_periods: Minimum observations for a value (defaults to window)
+
+        Returns:
+            DataFrame indexed by (date, symbol) with one column per symbol,
+            laid out like pandas' ``rolling(window).corr()``; dates with too
+            few observations hold NaN
+        """
+        if min_periods is None:
+            min_periods = window
+        if not self.symbol_results:
+            return pd.DataFrame()
+
+        log_returns = self._log_returns()
+
+        # The running-sum kernel only pays off compiled; plain Python
+        # delegates to pandas' rolling correlation
+        if not NUMBA_AVAILABLE:
+            return (
+                log_returns.astype(np.float64)
+                .rolling(window, min_periods=min_periods)
+                .corr()
+            )
+
+        values = log_returns.to_numpy(dtype=np.float64)
+        n_obs, k = values.shape
+        out = _rolling_corr(values, window, min_periods)
+        return pd.DataFrame(
+            out.reshape(n_obs * k, k),
+            index=pd.MultiIndex.from_product([log_returns.index, log_returns.columns]),
+            columns=log_returns.columns,
+        )
+
     def _prepare_correlation_data(self) -> List[List]:
         """Prepare correlation data for heatmap visualization"""
         corr_matrix = self._calculate_correlation_matrix()
-        correlation_data = []
-
-        for i in range(len(corr_matrix.index)):
-            for j in range(len(corr_matrix.columns)):
-                correlation_data.append(
-                    [
-                        i,  # x
-                        j,  # y
-                        round(corr_matrix.iloc[i, j], 2),  # correlation value
-                    ]
-                )
+        values = np.round(corr_matrix.to_numpy(dtype=np.float64), 2)
 
-        return correlation_data
+        # [x, y, correlation value] for every cell in row-major order
+        rows, cols = np.meshgrid(
+            np.arange(values.shape[0]), np.arange(values.shape[1]), indexing="ij"
+        )
+        return [
+            [i, j, v]
+            for i, j, v in zip(
+                rows.ravel().tolist(), cols.ravel().tolist(), values.ravel().tolist()
+            )
+        ]
 
     def _prepare_portfolio_equity_data(self) -> List[List]:
         """Prepare combined portfolio equity curve data"""
         # Combine equity curves with equal weighting
-        combined_equity = pd.DataFrame(
-            {
-                symbol: results.equity_curve
-                for symbol, results in self.symbol_results.items()
-            }
-        ).mean(axis=1)
+        combined_equity = self._equity_curves().mean(axis=1)
+        combined_equity = _downsample(combined_equity)
 
-        return [
-            [int(t.timestamp() * 1000), float(v)] for t, v in combined_equity.items()
-        ]
+        return _to_points(_epoch_ms(combined_equity.index), combined_equity)
 
     def _prepare_symbol_price_data(
         self, symbol: str, results: SymbolResults
     ) -> List[List]:
         """Prepare price data for symbol chart"""
-        if not hasattr(results, "portfolio") or results.portfolio is None:
+        portfolio = getattr(results, "portfolio", None)
+        if portfolio is None:
             logging.warning(f"No portfolio data available for symbol {symbol}")
             return []
 
-        return [
-            [int(t.timestamp() * 1000), float(p)]
-            for t, p in zip(results.portfolio.index, results.portfolio["close"])
-        ]
+        close = _downsample(portfolio["close"])
+        return _to_points(_epoch_ms(close.index), close)
 
     def _prepare_symbol_trade_annotations(self, trades: List[Dict]) -> List[Dict]:
         """Prepare trade annotations for symbol chart"""
-        annotations = []
-        for trade in trades:
-            timestamp = pd.Timestamp(trade["timestamp"]).timestamp() * 1000
-            price = float(trade["price"])
-            trade_type = trade["type"].upper()
-
-            annotation = {
-                "x": int(timestamp),
+        if not trades:
+            return []
+
+        # Convert all trade timestamps and prices in one go; only the labels
+        # are formatted per trade
+        timestamps = _epoch_ms(pd.to_datetime([t["timestamp"] for t in trades]))
+        prices = np.fromiter(
+            (t["price"] for t in trades), dtype=np.float64, count=len(trades)
+        )
+        trade_types = [t["type"].upper() for t in trades]
+
+        return [
+            {
+                "x": timestamp,
                 "y": price,
                 "title": "↑" if trade_type == "BUY" else "↓",
                 "text": f"{trade_type} @ ${price:,.2f}\nQty: {trade['quantity']}",
                 "className": f"trade-{trade_type.lower()}",
             }
-            annotations.append(annotation)
-        return annotations
+            for timestamp, price, trade_type, trade in zip(
+                timestamps.tolist(), prices.tolist(), trade_types, trades
+            )
+        ]
+
+    def _build_symbol_entry(self, symbol: str, results: SymbolResults) -> Dict:
+        """Convert one symbol's results into native Python types for the template"""
+        # Extract metrics properly
+        perf_metrics = {
+            m["title"]: m["value"] for m in results.metrics["Performance Metrics"]
+        }
+        risk_metrics = {m["title"]: m["value"] for m in results.metrics["Risk Metrics"]}
+        trade_metrics = {
+            m["title"]: m["value"] for m in results.metrics["Trading Statistics"]
+        }
+        total_return = _raw_value(results.metrics["Performance Metrics"][1])
+        annual_return = _raw_value(results.metrics["Performance Metrics"][2])
+        avg_trade_return = _raw_value(results.metrics["Trading Statistics"][3])
+
+        # The benchmark is plotted against the equity curve's timestamps, so
+        # both are sampled at the same positions
+        positions = _sample_positions(len(results.equity_curve))
+        equity_curve = results.equity_curve
+        benchmark_curve = results.benchmark_data["value"].iloc[: len(equity_curve)]
+        if positions is not None:
+            equity_curve = equity_curve.iloc[positions]
+            benchmark_curve = benchmark_curve.iloc[
+                positions[positions < len(benchmark_curve)]
+            ]
+        timestamps = _epoch_ms(equity_curve.index)
+        drawdown = _downsample(results.drawdown)
+        monthly_returns = results.monthly_returns["returns"]
+
+        return {
+            "trades": [
+                {
+                    "timestamp": (
+                        pd.Timestamp(trade["timestamp"]).strftime("%Y-%m-%d %H:%M")
+                        if isinstance(trade["timestamp"], str)
+                        else trade["timestamp"].strftime("%Y-%m-%d %H:%M")
+                    ),
+                    "type": trade["type"].upper(),
+                    "price": float(trade["price"]),
+                    "quantity": int(trade["quantity"]),
+                    "cost": float(abs(trade.get("cost", 0))),
+                    "commission": float(trade.get("commission", 0)),
+                    "pnl": float(trade.get("pnl", 0)),
+                }
+                for trade in results.trades
+            ],
+            "metrics": {
+                "Performance Metrics": [
+                    {
+                        "title": "Total Return",
+                        "value": perf_metrics["Total Return"],
+                        "color": ("positive" if total_return > 0 else "negative"),
+                    },
+                    {
+                        "title": "Annual Return",
+                        "value": perf_metrics["Annual Return"],
+                        "color": ("positive" if annual_return > 0 else "negative"),
+                    },
+                    {
+                        "title": "Sharpe Ratio",
+                        "value": perf_metrics["Sharpe Ratio"],
+                    },
+                    {
+                        "title": "Sortino Ratio",
+                        "value": perf_metrics["Sortino Ratio"],
+                    },
+                ],
+                "Risk Metrics": [
+                    {
+                        "title": "Max Drawdown",
+                        "value": risk_metrics["Max Drawdown"],
+                        "color": "negative",
+                    },
+                    {"title": "Volatility", "value": risk_metrics["Volatility"]},
+                    {
+                        "title": "Value at Risk",
+                        "value": risk_metrics["Value at Risk (95%)"],
+                    },
+                ],
+                "Trading Statistics": [
+                    {
+                        "title": "Total Trades",
+                        "value": trade_metrics["Total Trades"],
+                    },
+                    {"title": "Win Rate", "value": trade_metrics["Win Rate"]},
+                    {
+                        "title": "Profit Factor",
+                        "value": trade_metrics["Profit Factor"],
+                    },
+                    {
+                        "title": "Average Trade Return",
+                        "value": trade_metrics["Average Trade Return"],
+                        "color": ("positive" if avg_trade_return > 0 else "negative"),
+                    },
+                    {
+                        "title": "Average Win",
+                        "value": trade_metrics["Average Win"],
+                        "color": "positive",
+                    },
+                    {
+                        "title": "Average Loss",
+                        "value": trade_metrics["Average Loss"],
+                        "color": "negative",
+                    },
+                    {
+                        "title": "Largest Win",
+                        "value": trade_metrics["Largest Win"],
+                        "color": "positive",
+                    },
+                    {
+                        "title": "Largest Loss",
+                        "value": trade_metrics["Largest Loss"],
+                        "color": "negative",
+                    },
+                    {
+                        "title": "Max Consec. Wins",
+                        "value": trade_metrics["Max Consecutive Wins"],
+                    },
+                    # {'title': 'Max Consecutive Losses', 'value': trade_metrics['Max Consecutive Losses']}
+                ],
+            },
+            "total_return": total_return,
+            "equity_curve": _to_points(timestamps, equity_curve),
+            "benchmark_curve": _to_points(timestamps, benchmark_curve),
+            "drawdown": _to_points(_epoch_ms(drawdown.index), drawdown),
+            "monthly_returns": _to_points(
+                _epoch_ms(monthly_returns.index), monthly_returns
+            ),
+            "price_data": self._prepare_symbol_price_data(symbol, results),
+            "trade_annotations": self._prepare_symbol_trade_annotations(results.trades),
+        }
 
     def generate_report(self, output_dir: str) -> None:
         """Generate HTML report for multi-symbol backtest"""
@@ -180,7 +517,7 @@ class StrategyBacktestReport:
             os.path.dirname(__file__), "../templates/strategy_backtest_report.html"
         )
         with open(template_path, "r") as f:
-            template = Template(f.read())
+            template = _template_env.from_string(f.read())
 
         # Calculate portfolio-level metrics
         portfolio_metrics = self._calculate_portfolio_metrics()
@@ -210,159 +547,32 @@ class StrategyBacktestReport:
             },
         ]
 
-        # Convert numpy types to native Python types in symbol results
-        symbol_results_data = {}
-        for symbol, results in self.symbol_results.items():
-            # Extract metrics properly
-            perf_metrics = {
-                m["title"]: m["value"] for m in results.metrics["Performance Metrics"]
-            }
-            risk_metrics = {
-                m["title"]: m["value"] for m in results.metrics["Risk Metrics"]
-            }
-            trade_metrics = {
-                m["title"]: m["value"] for m in results.metrics["Trading Statistics"]
-            }
-
-            timestamps = [
-                int(pd.Timestamp(t).timestamp() * 1000)
-                for t in results.equity_curve.index
+        # Convert numpy types to native Python types in symbol results; the
+        # symbols are independent, so build their entries concurrently
+        symbols = list(self.symbol_results)
+        if len(symbols) > 1:
+            max_workers = min(len(symbols), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                entries = list(
+                    executor.map(
+                        self._build_symbol_entry,
+                        symbols,
+                        self.symbol_results.values(),
+                    )
+                )
+        else:
+            entries = [
+                self._build_symbol_entry(symbol, results)
+                for symbol, results in self.symbol_results.items()
             ]
+        symbol_results_data = dict(zip(symbols, entries))
 
-            symbol_results_data[symbol] = {
-                "trades": [
-                    {
-                        "timestamp": (
-                            pd.Timestamp(trade["timestamp"]).strftime("%Y-%m-%d %H:%M")
-                            if isinstance(trade["timestamp"], str)
-                            else trade["timestamp"].strftime("%Y-%m-%d %H:%M")
-                        ),
-                        "type": trade["type"].upper(),
-                        "price": float(trade["price"]),
-                        "quantity": int(trade["quantity"]),
-                        "cost": float(abs(trade.get("cost", 0))),
-                        "commission": float(trade.get("commission", 0)),
-                        "pnl": float(trade.get("pnl", 0)),
-                    }
-                    for trade in results.trades
-                ],
-                "metrics": {
-                    "Performance Metrics": [
-                        {
-                            "title": "Total Return",
-                            "value": perf_metrics["Total Return"],
-                            "color": (
-                                "positive"
-                                if float(perf_metrics["Total Return"].strip("%")) > 0
-                                else "negative"
-                            ),
-                        },
-                        {
-                            "title": "Annual Return",
-                            "value": perf_metrics["Annual Return"],
-                            "color": (
-                                "positive"
-                                if float(perf_metrics["Annual Return"].strip("%")) > 0
-                                else "negative"
-                            ),
-                        },
-                        {
-                            "title": "Sharpe Ratio",
-                            "value": perf_metrics["Sharpe Ratio"],
-                        },
-                        {
-                            "title": "Sortino Ratio",
-                            "value": perf_metrics["Sortino Ratio"],
-                        },
-                    ],
-                    "Risk Metrics": [
-                        {
-                            "title": "Max Drawdown",
-                            "value": risk_metrics["Max Drawdown"],
-                            "color": "negative",
-                        },
-                        {"title": "Volatility", "value": risk_metrics["Volatility"]},
-                        {
-                            "title": "Value at Risk",
-                            "value": risk_metrics["Value at Risk (95%)"],
-                        },
-                    ],
-                    "Trading Statistics": [
-                        {
-                            "title": "Total Trades",
-                            "value": trade_metrics["Total Trades"],
-                        },
-                        {"title": "Win Rate", "value": trade_metrics["Win Rate"]},
-                        {
-                            "title": "Profit Factor",
-                            "value": trade_metrics["Profit Factor"],
-                        },
-                        {
-                            "title": "Average Trade Return",
-                            "value": trade_metrics["Average Trade Return"],
-                            "color": (
-                                "positive"
-                                if float(
-                                    trade_metrics["Average Trade Return"]
-                                    .strip("$")
-                                    .replace(",", "")
-                                )
-                                > 0
-                                else "negative"
-                            ),
-                        },
-                        {
-                            "title": "Average Win",
-                            "value": trade_metrics["Average Win"],
-                            "color": "positive",
-                        },
-                        {
-                            "title": "Average Loss",
-                            "value": trade_metrics["Average Loss"],
-                            "color": "negative",
-                        },
-                        {
-                            "title": "Largest Win",
-                            "value": trade_metrics["Largest Win"],
-                            "color": "positive",
-                        },
-                        {
-                            "title": "Largest Loss",
-                            "value": trade_metrics["Largest Loss"],
-                            "color": "negative",
-                        },
-                        {
-                            "title": "Max Consec. Wins",
-                            "value": trade_metrics["Max Consecutive Wins"],
-                        },
-                        # {'title': 'Max Consecutive Losses', 'value': trade_metrics['Max Consecutive Losses']}
-                    ],
-                },
-                "total_return": float(perf_metrics["Total Return"].strip("%")),
-                "equity_curve": [
-                    [ts, float(v)]
-                    for ts, v in zip(timestamps, results.equity_curve.values)
-                ],
-                "benchmark_curve": [
-                    [ts, float(v)]
-                    for ts, v in zip(timestamps, results.benchmark_data["value"].values)
-                ],
-                "drawdown": [
-                    [int(pd.Timestamp(t).timestamp() * 1000), float(v)]
-                    for t, v in results.drawdown.items()
-                ],
-                "monthly_returns": [
-                    [int(pd.Timestamp(t).timestamp() * 1000), float(v)]
-                    for t, v in results.monthly_returns["returns"].items()
-                ],
-                "price_data": self._prepare_symbol_price_data(symbol, results),
-                "trade_annotations": self._prepare_symbol_trade_annotations(
-                    results.trades
-                ),
-            }
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
 
-        # Generate HTML content
-        html_content = template.render(
+        # Stream the HTML straight to disk rather than rendering it to one string
+        output_path = os.path.join(output_dir, "strategy_backtest_report.html")
+        template.stream(
             strategy_name=self.strategy_name,
             start_date=self.start_date.strftime("%Y-%m-%d"),
             end_date=self.end_date.strftime("%Y-%m-%d"),
@@ -371,12 +581,4 @@ class StrategyBacktestReport:
             correlation_data=correlation_data,
             portfolio_equity_data=portfolio_equity_data,
             symbol_results=symbol_results_data,
-        )
-
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-
-        # Write HTML file
-        output_path = os.path.join(output_dir, "strategy_backtest_report.html")
-        with open(output_path, "w") as f:
-            f.write(html_content)
+        ).dump(output_path, encoding="utf-8")
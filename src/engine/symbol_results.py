@@ -3,6 +3,7 @@ from typing import Dict, List, Any
 import pandas as pd
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -153,19 +154,25 @@ class BacktestReport:
             portfolio=portfolio,
             trades=trades,
             monthly_returns=metrics["monthly_returns"],
-            fundamental_data=None,
             benchmark_data=metrics["benchmark_data"],
         )
 
     def _calculate_drawdowns(self) -> pd.Series:
         """Calculate drawdown series for plotting"""
-        cumulative_returns = (1 + self.portfolio["returns"]).cumprod()
-        rolling_max = cumulative_returns.expanding().max()
-        drawdowns = cumulative_returns / rolling_max - 1
-        return drawdowns
+        cumulative_returns = np.cumprod(1 + self.portfolio["returns"].to_numpy())
+        rolling_max = np.maximum.accumulate(cumulative_returns)
+        return pd.Series(
+            cumulative_returns / rolling_max - 1, index=self.portfolio.index
+        )
 
     def _get_metrics_dict(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Organize metrics into groups for HTML report"""
+        """
+        Organize metrics into groups for HTML report.
+
+        Each numeric metric carries its formatted "value" and, under "raw",
+        the unformatted number it was formatted from (in the displayed unit,
+        e.g. percent for percentages).
+        """
         metrics = {
             "Strategy Info": [
                 {"title": "Strategy", "value": self.strategy_name},
@@ -174,97 +181,142 @@ class BacktestReport:
                     "title": "Period",
                     "value": f"{self.start_date.strftime('%Y-%m-%d')} to {self.end_date.strftime('%Y-%m-%d')}",
                 },
-                {"title": "Initial Capital", "value": f"${self.initial_capital:,.2f}"},
+                {
+                    "title": "Initial Capital",
+                    "value": f"${self.initial_capital:,.2f}",
+                    "raw": self.initial_capital,
+                },
                 {
                     "title": "Commission Rate",
                     "value": f"{self.commission_rate*100:.2f}%",
+                    "raw": self.commission_rate * 100,
                 },
             ],
             "Performance Metrics": [
                 {
                     "title": "Final Portfolio Value",
                     "value": f"${self.final_portfolio_value:,.2f}",
+                    "raw": self.final_portfolio_value,
                 },
                 {
                     "title": "Total Return",
                     "value": f"{self.total_return*100:.2f}%",
+                    "raw": self.total_return * 100,
                     "color": "positive" if self.total_return > 0 else "negative",
                 },
                 {
                     "title": "Annual Return",
                     "value": f"{self.annual_return*100:.2f}%",
+                    "raw": self.annual_return * 100,
                     "color": "positive" if self.annual_return > 0 else "negative",
                 },
-                {"title": "Sharpe Ratio", "value": f"{self.sharpe_ratio:.2f}"},
-                {"title": "Sortino Ratio", "value": f"{self.sortino_ratio:.2f}"},
+                {
+                    "title": "Sharpe Ratio",
+                    "value": f"{self.sharpe_ratio:.2f}",
+                    "raw": self.sharpe_ratio,
+                },
+                {
+                    "title": "Sortino Ratio",
+                    "value": f"{self.sortino_ratio:.2f}",
+                    "raw": self.sortino_ratio,
+                },
             ],
             "Risk Metrics": [
                 {
                     "title": "Max Drawdown",
                     "value": f"{self.max_drawdown*100:.2f}%",
+                    "raw": self.max_drawdown * 100,
                     "color": "negative",
                 },
                 {
                     "title": "Max Drawdown Duration",
                     "value": f"{self.max_drawdown_duration} days",
+                    "raw": self.max_drawdown_duration,
+                },
+                {
+                    "title": "Volatility",
+                    "value": f"{self.volatility*100:.2f}%",
+                    "raw": self.volatility * 100,
                 },
-                {"title": "Volatility", "value": f"{self.volatility*100:.2f}%"},
                 {
                     "title": "Value at Risk (95%)",
                     "value": f"{self.value_at_risk*100:.2f}%",
+                    "raw": self.value_at_risk * 100,
                 },
-                {"title": "Beta", "value": f"{self.beta:.2f}"},
+                {"title": "Beta", "value": f"{self.beta:.2f}", "raw": self.beta},
             ],
             "Trading Statistics": [
-                {"title": "Total Trades", "value": str(self.total_trades)},
-                {"title": "Win Rate", "value": f"{self.win_rate*100:.2f}%"},
-                {"title": "Profit Factor", "value": f"{self.profit_factor:.2f}"},
+                {
+                    "title": "Total Trades",
+                    "value": str(self.total_trades),
+                    "raw": self.total_trades,
+                },
+                {
+                    "title": "Win Rate",
+                    "value": f"{self.win_rate*100:.2f}%",
+                    "raw": self.win_rate * 100,
+                },
+                {
+                    "title": "Profit Factor",
+                    "value": f"{self.profit_factor:.2f}",
+                    "raw": self.profit_factor,
+                },
                 {
                     "title": "Average Trade Return",
                     "value": f"${self.avg_trade_return:,.2f}",
+                    "raw": self.avg_trade_return,
                     "color": "positive" if self.avg_trade_return > 0 else "negative",
                 },
                 {
                     "title": "Average Win",
                     "value": f"${self.avg_win:,.2f}",
+                    "raw": self.avg_win,
                     "color": "positive",
                 },
                 {
                     "title": "Average Loss",
                     "value": f"${self.avg_loss:,.2f}",
+                    "raw": self.avg_loss,
                     "color": "negative",
                 },
                 {
                     "title": "Largest Win",
                     "value": f"${self.largest_win:,.2f}",
+                    "raw": self.largest_win,
                     "color": "positive",
                 },
                 {
                     "title": "Largest Loss",
                     "value": f"${self.largest_loss:,.2f}",
+                    "raw": self.largest_loss,
                     "color": "negative",
                 },
                 {
                     "title": "Max Consecutive Wins",
                     "value": str(self.max_consecutive_wins),
+                    "raw": self.max_consecutive_wins,
                 },
                 {
                     "title": "Max Consecutive Losses",
                     "value": str(self.max_consecutive_losses),
+                    "raw": self.max_consecutive_losses,
                 },
             ],
             "Position Info": [
                 {
                     "title": "Average Position Size",
                     "value": f"{self.avg_position_size:,.0f} units",
+                    "raw": self.avg_position_size,
                 },
                 {
                     "title": "Max Position Size",
                     "value": f"{self.max_position_size:,.0f} units",
+                    "raw": self.max_position_size,
                 },
                 {
                     "title": "Average Position Duration",
                     "value": f"{self.avg_position_duration:.1f} days",
+                    "raw": self.avg_position_duration,
                 },
             ],
         }
@@ -320,16 +372,31 @@ class SymbolResults:
     benchmark_data: pd.DataFrame
 
     @classmethod
-    def from_backtest_report(cls, report: BacktestReport) -> "SymbolResults":
-        """Create SymbolResults from a BacktestReport instance"""
+    def from_backtest_report(
+        cls, report: BacktestReport, dtype: Optional[np.dtype] = None
+    ) -> "SymbolResults":
+        """
+        Create SymbolResults from a BacktestReport instance
+
+        Args:
+            report: Single-symbol backtest report
+            dtype: Optional storage dtype (e.g. np.float32) for the equity
+                curve and benchmark values; by default they are kept as-is
+        """
+        equity_curve = report.portfolio["total"]
+        benchmark_data = report.benchmark_data
+        if dtype is not None:
+            equity_curve = equity_curve.astype(dtype, copy=False)
+            benchmark_data = benchmark_data.astype({"value": dtype}, copy=False)
+
         return cls(
             symbol=report.symbol,
             trades=report.trades,
             metrics=report._get_metrics_dict(),
-            equity_curve=report.portfolio["total"],
+            equity_curve=equity_curve,
             drawdown=report._calculate_drawdowns(),
             monthly_returns=report.monthly_returns,
             trade_annotations=report._prepare_trade_annotations(),
             portfolio=report.portfolio,
-            benchmark_data=report.benchmark_data,
+            benchmark_data=benchmark_data,
         )
@@ -1,12 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Hashable
+import hashlib
 import pandas as pd
 import numpy as np
 import logging
 from datetime import datetime
 
+# Default memory budget of the prepare_data cache once it is enabled
+INDICATOR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Strategy attributes that never affect the indicators and stay out of the
+# prepare_data cache key
+_NON_INDICATOR_STATE = frozenset({"logger", "signals", "position"})
+
 
 class BaseStrategy(ABC):
+    # Prepared (full, trading, nbytes) entries shared across strategy instances
+    # so a parameter sweep or repeated run reuses indicators for identical
+    # inputs. Off by default because a single run never hits it; see
+    # enable_indicator_cache
+    _indicator_cache: (
+        "OrderedDict[Hashable, Tuple[pd.DataFrame, pd.DataFrame, int]]"
+    ) = OrderedDict()
+    _indicator_cache_nbytes: int = 0
+    _indicator_cache_max_bytes: int = 0
+
     def __init__(self, parameters: Dict[str, Any] = None):
         self.parameters = parameters or {}
         self.position = 0
@@ -83,6 +102,119 @@ class BaseStrategy(ABC):
                 - DataFrame with indicators (including warmup)
                 - DataFrame with indicators (warmup removed)
         """
+        if not BaseStrategy._indicator_cache_max_bytes:
+            return self._prepare_data(data, start_date, end_date)
+
+        try:
+            key = self._indicator_cache_key(data, start_date, end_date)
+        except TypeError:
+            # Unhashable parameter values; compute without caching
+            return self._prepare_data(data, start_date, end_date)
+
+        cache = BaseStrategy._indicator_cache
+        if key not in cache:
+            calculated, trading_period = self._prepare_data(data, start_date, end_date)
+            self._store_prepared(key, calculated, trading_period)
+            return calculated, trading_period
+
+        # Hits hand out copies so callers cannot mutate the cached frames
+        cache.move_to_end(key)
+        calculated, trading_period, _ = cache[key]
+        if trading_period is calculated:
+            calculated = calculated.copy()
+            return calculated, calculated
+        return calculated.copy(), trading_period.copy()
+
+    @staticmethod
+    def _store_prepared(
+        key: Hashable, calculated: pd.DataFrame, trading_period: pd.DataFrame
+    ) -> None:
+        """Add prepared frames to the cache, evicting the oldest over budget"""
+        nbytes = int(calculated.memory_usage(index=True, deep=True).sum())
+        if trading_period is not calculated:
+            nbytes += int(trading_period.memory_usage(index=True, deep=True).sum())
+        if nbytes > BaseStrategy._indicator_cache_max_bytes:
+            return  # Larger than the whole budget; not worth evicting for
+
+        cache = BaseStrategy._indicator_cache
+        cache[key] = (calculated, trading_period, nbytes)
+        BaseStrategy._indicator_cache_nbytes += nbytes
+        while BaseStrategy._indicator_cache_nbytes > (
+            BaseStrategy._indicator_cache_max_bytes
+        ):
+            _, (_, _, evicted) = cache.popitem(last=False)
+            BaseStrategy._indicator_cache_nbytes -= evicted
+
+    @classmethod
+    def enable_indicator_cache(cls, max_bytes: int = INDICATOR_CACHE_MAX_BYTES) -> None:
+        """
+        Cache prepare_data results across runs and strategy instances.
+
+        Worth enabling for parameter sweeps or repeated runs over the same
+        data. Entries are evicted oldest first once their frames exceed
+        max_bytes. The frames returned on a miss are the cached ones, so
+        while caching is enabled treat the input data and the prepared
+        frames as read-only.
+
+        Args:
+            max_bytes: Memory budget for the cached frames; 0 disables
+        """
+        BaseStrategy._indicator_cache_max_bytes = max_bytes
+        if not max_bytes:
+            cls.clear_indicator_cache()
+
+    @classmethod
+    def disable_indicator_cache(cls) -> None:
+        """Stop caching prepare_data results and release the cached frames"""
+        cls.enable_indicator_cache(0)
+
+    @classmethod
+    def clear_indicator_cache(cls) -> None:
+        """Clear the prepared data cache"""
+        BaseStrategy._indicator_cache.clear()
+        BaseStrategy._indicator_cache_nbytes = 0
+
+    def _indicator_cache_key(
+        self, data: pd.DataFrame, start_date: datetime, end_date: datetime
+    ) -> Hashable:
+        """Build the prepare_data cache key; raises TypeError if unhashable"""
+        digest = hashlib.blake2b(
+            pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes(),
+            digest_size=16,
+        ).hexdigest()
+        key = (
+            self.__class__,
+            self._indicator_state(),
+            tuple(data.columns),
+            digest,
+            start_date,
+            end_date,
+        )
+        hash(key)
+        return key
+
+    def _indicator_state(self) -> frozenset:
+        """
+        Instance state that can drive calculate_indicators.
+
+        Strategies copy their settings from parameters into attributes, and
+        sweeps change those attributes afterwards, so the instance attributes
+        are used rather than parameters. Bookkeeping attributes and patched-in
+        callables are left out; dict values are frozen.
+        """
+        state = []
+        for name, value in vars(self).items():
+            if name in _NON_INDICATOR_STATE or callable(value):
+                continue
+            if isinstance(value, dict):
+                value = frozenset(value.items())
+            state.append((name, value))
+        return frozenset(state)
+
+    def _prepare_data(
+        self, data: pd.DataFrame, start_date: datetime, end_date: datetime
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Calculate indicators and split off the trading period"""
         # Calculate indicators on full dataset
         calculated = self.calculate_indicators(data)
 
@@ -90,10 +222,18 @@ class BaseStrategy(ABC):
         if self.get_required_warmup_period() == 0:
             return calculated, calculated
 
-        # Convert time_key to datetime if it's not already
+        # Index by time_key as datetime if it's not already. The frame is
+        # rebuilt around its own column arrays because set_index would copy
+        # every block
         if not pd.api.types.is_datetime64_any_dtype(calculated.index):
-            calculated = calculated.set_index("time_key", drop=False)
-            calculated.index = pd.to_datetime(calculated.index)
+            index = pd.DatetimeIndex(
+                pd.to_datetime(calculated["time_key"]), name="time_key"
+            )
+            calculated = pd.DataFrame(
+                {name: calculated[name].array for name in calculated.columns},
+                index=index,
+                copy=False,
+            )
 
         # Get the trading period data based on user-specified dates
         mask = pd.Series(True, index=calculated.index)
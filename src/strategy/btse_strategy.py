@@ -112,7 +112,7 @@ class BTSEStrategy(BaseStrategy):
         condition_w = (zig_ma > zig) & (zig_ma.shift(1) <= zig.shift(1))
 
         # Generate signals
-        signals = pd.Series(0, index=data.index)
+        signals = pd.Series(np.zeros(len(data), dtype=np.int8), index=data.index)
         signals[condition_d & condition_a] = 1  # Buy signal
         signals[condition_w] = -1  # Sell signal
 
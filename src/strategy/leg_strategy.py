@@ -96,7 +96,7 @@ class LEGStrategy(BaseStrategy):
         enter_pattern, leave_pattern = self.check_pattern(data)
 
         # Generate signals
-        signals = pd.Series(0, index=data.index)
+        signals = pd.Series(np.zeros(len(data), dtype=np.int8), index=data.index)
 
         # Buy signals (ENTER conditions)
         buy_signals = enter_pattern
@@ -38,6 +38,7 @@ Notes:
 """
 
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
 from .base_strategy import BaseStrategy
 
@@ -117,7 +118,7 @@ class MACDStrategy(BaseStrategy):
         Returns:
             pd.Series: Trading signals aligned with the input data's index
         """
-        signals = pd.Series(0, index=data.index)
+        signals = pd.Series(np.zeros(len(data), dtype=np.int8), index=data.index)
 
         # Generate signals using the clean data
         signals[data["MACD"] > data["Signal"]] = 1
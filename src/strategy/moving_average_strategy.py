@@ -33,10 +33,89 @@ Notes:
 """
 
 from typing import Dict, Any
+import numpy as np
 import pandas as pd
+from src.utils.jit import njit, NUMBA_AVAILABLE
 from .base_strategy import BaseStrategy
 
 
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing simple moving average with partial windows at the start.
+
+    Equivalent to ``rolling(window, min_periods=1).mean()`` but computed from
+    prefix sums, so each output is O(1) regardless of the window. As in
+    pandas, NaN values are skipped and a window with no valid value is NaN.
+    """
+    if len(values) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    # Summing deviations from the first valid value keeps the prefix sum
+    # small, limiting cancellation error on long series
+    valid = ~np.isnan(values)
+    offset = values[valid.argmax()] if valid.any() else 0.0
+    deviations = np.where(valid, values - offset, 0.0)
+    csum = np.concatenate(([0.0], np.cumsum(deviations, dtype=np.float64)))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    counts = ccount[ends] - ccount[starts]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (csum[ends] - csum[starts]) / counts + offset
+
+
+@njit(cache=True)
+def _moving_averages(close, short_window, long_window):
+    """
+    Short and long trailing SMAs (partial windows at the start) in one pass.
+
+    Both windows are maintained as running sums and valid-close counts,
+    adding the new close and subtracting the one leaving the window, so each
+    bar costs O(1). NaN closes are skipped and a window without any valid
+    close is NaN, matching ``rolling(window, min_periods=1).mean()``.
+    Compiled without fastmath, which would let the NaN checks be dropped.
+    """
+    n = len(close)
+    sma_short = np.empty(n, dtype=np.float64)
+    sma_long = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return sma_short, sma_long
+
+    # Deviations from the first valid close keep the running sums small
+    offset = 0.0
+    for i in range(n):
+        if not np.isnan(close[i]):
+            offset = close[i]
+            break
+
+    sum_short = 0.0
+    sum_long = 0.0
+    count_short = 0
+    count_long = 0
+    for i in range(n):
+        x = close[i]
+        if not np.isnan(x):
+            sum_short += x - offset
+            sum_long += x - offset
+            count_short += 1
+            count_long += 1
+        if i >= short_window:
+            x = close[i - short_window]
+            if not np.isnan(x):
+                sum_short -= x - offset
+                count_short -= 1
+        if i >= long_window:
+            x = close[i - long_window]
+            if not np.isnan(x):
+                sum_long -= x - offset
+                count_long -= 1
+        sma_short[i] = sum_short / count_short + offset if count_short else np.nan
+        sma_long[i] = sum_long / count_long + offset if count_long else np.nan
+
+    return sma_short, sma_long
+
+
 class MovingAverageCrossStrategy(BaseStrategy):
     def __init__(self, parameters: Dict[str, Any] = None):
         """
@@ -79,30 +158,26 @@ class MovingAverageCrossStrategy(BaseStrategy):
             pd.DataFrame: Original data with additional columns:
                 - SMA_short: Short-term simple moving average
                 - SMA_long: Long-term simple moving average
+            The original columns are shared with ``data`` rather than copied,
+            so modify the result only after taking a copy
         """
-        data = data.copy()
-
-        # Calculate short-term moving average
-        data["SMA_short"] = (
-            data["close"]
-            .rolling(
-                window=self.short_window,
-                min_periods=1,  # Allow partial windows at the start
-            )
-            .mean()
-        )
-
-        # Calculate long-term moving average
-        data["SMA_long"] = (
-            data["close"]
-            .rolling(
-                window=self.long_window,
-                min_periods=1,  # Allow partial windows at the start
+        close = data["close"].to_numpy(dtype=np.float64)
+
+        # Partial windows are allowed at the start (min_periods=1). The fused
+        # kernel is only worth it compiled; plain Python uses prefix sums
+        if NUMBA_AVAILABLE:
+            sma_short, sma_long = _moving_averages(
+                close, self.short_window, self.long_window
             )
-            .mean()
-        )
+        else:
+            sma_short = _rolling_mean(close, self.short_window)
+            sma_long = _rolling_mean(close, self.long_window)
 
-        return data
+        # The new columns are attached without copying the OHLCV blocks
+        columns = {name: data[name] for name in data.columns}
+        columns["SMA_short"] = sma_short
+        columns["SMA_long"] = sma_long
+        return pd.DataFrame(columns, index=data.index, copy=False)
 
     def get_required_warmup_period(self) -> int:
         """
@@ -128,13 +203,13 @@ class MovingAverageCrossStrategy(BaseStrategy):
             pd.Series: Trading signals aligned with the input data's index
         """
         # No need to handle warmup here since it's handled by prepare_data
-        signals = pd.Series(0, index=data.index)
-
-        # Generate signals using the clean data
-        signals[data["SMA_short"] > data["SMA_long"]] = 1
-        signals[data["SMA_short"] < data["SMA_long"]] = -1
+        sma_short = data["SMA_short"].to_numpy(dtype=np.float64)
+        sma_long = data["SMA_long"].to_numpy(dtype=np.float64)
+        diff = sma_short - sma_long
 
-        return signals
+        # The sign of the spread is the signal; undefined spreads hold
+        np.nan_to_num(diff, copy=False, nan=0.0)
+        return pd.Series(np.sign(diff).astype(np.int8), index=data.index)
 
     def validate_parameters(self) -> bool:
         """
@@ -0,0 +1,29 @@
+"""
+Optional orjson support.
+
+Exposes a ``dumps`` with the ``json.dumps`` call signature used by Jinja's
+``tojson`` filter. It encodes with orjson when it is installed, and falls
+back to the standard library otherwise or for objects orjson rejects.
+"""
+
+import json
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj, sort_keys: bool = False, **kwargs) -> str:
+    """Serialize ``obj`` to a JSON string"""
+    if ORJSON_AVAILABLE and not kwargs:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass  # Unsupported type; let the standard encoder handle or reject it
+    return json.dumps(obj, sort_keys=sort_keys, **kwargs)
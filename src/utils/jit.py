@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT support.
+
+Exposes ``njit`` from numba when it is installed. Otherwise ``njit`` is a
+pass-through decorator, so jitted kernels still run as plain Python.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
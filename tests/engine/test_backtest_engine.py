@@ -0,0 +1,298 @@
+import logging
+import pytest
+import src.engine.backtest_engine as backtest_engine
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from src.engine.backtest_engine import BacktestEngine
+from src.engine._sim_kernel import simulate, BUY, SELL
+from src.engine.metrics.return_metrics import ReturnMetrics
+from src.engine.symbol_results import SymbolResults
+from src.strategy.macd_strategy import MACDStrategy
+from src.strategy.moving_average_strategy import MovingAverageCrossStrategy
+
+
+class TestBacktestEngine:
+    @pytest.fixture
+    def engine(self):
+        return BacktestEngine(
+            MACDStrategy({}), initial_capital=10000.0, commission=0.001, lot_size=10
+        )
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create a short price series with one round-trip trade"""
+        return pd.DataFrame(
+            {
+                "time_key": pd.date_range(start="2024-01-01", periods=6, freq="D")
+                .strftime("%Y-%m-%d %H:%M:%S")
+                .tolist(),
+                "close": [100.0, 100.0, 110.0, 120.0, 115.0, 130.0],
+            }
+        )
+
+    @pytest.fixture
+    def random_walk_data(self):
+        """Factory for a daily geometric random-walk close series"""
+
+        def make(seed, periods=200, string_time_key=False):
+            rng = np.random.default_rng(seed)
+            close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, periods)))
+            time_key = pd.date_range(start="2023-01-01", periods=periods, freq="D")
+            if string_time_key:
+                time_key = time_key.strftime("%Y-%m-%d %H:%M:%S").tolist()
+            return pd.DataFrame({"time_key": time_key, "close": close})
+
+        return make
+
+    def test_simulate_portfolio(self, engine, sample_data):
+        """Test position and cash bookkeeping for a buy followed by a sell"""
+        signals = pd.Series([0, 1, 1, 1, -1, 0])
+        portfolio, trades, _ = engine._simulate(sample_data, signals)
+
+        # Buy 90 units (9 lots) at 100 on bar 1, sell them at 115 on bar 4
+        cost = 90 * 100.0 * 1.001
+        proceeds = 90 * 115.0 * 0.999
+        assert portfolio["position"].tolist() == [0, 90, 90, 90, 0, 0]
+        assert portfolio["cash"].iloc[0] == 10000.0
+        assert portfolio["cash"].iloc[1] == pytest.approx(10000.0 - cost)
+        assert portfolio["cash"].iloc[-1] == pytest.approx(10000.0 - cost + proceeds)
+
+        # Portfolio values are derived from position and cash
+        expected_total = (
+            portfolio["cash"] + portfolio["position"] * sample_data["close"].to_numpy()
+        )
+        np.testing.assert_allclose(portfolio["total"], expected_total)
+        assert portfolio["returns"].iloc[0] == 0
+        # Returns are computed in float64 before the columns are downcast
+        np.testing.assert_allclose(
+            portfolio["returns"].iloc[1:],
+            portfolio["total"].pct_change().iloc[1:],
+            atol=1e-6,
+        )
+        assert portfolio["total"].dtype == np.float64
+        assert portfolio["returns"].dtype == np.float32
+        assert portfolio["position"].dtype == np.int64
+
+        # Index is the parsed time_key
+        assert isinstance(portfolio.index, pd.DatetimeIndex)
+        assert portfolio.index[0] == pd.Timestamp("2024-01-01")
+
+    def test_large_position_does_not_wrap(self, engine, sample_data):
+        """Test that positions above the int32 range are stored exactly"""
+        engine.initial_capital = 1e12
+        engine.lot_size = 1
+        signals = pd.Series([0, 1, 0, 0, 0, 0])
+        portfolio, trades, _ = engine._simulate(sample_data.assign(close=0.01), signals)
+
+        assert trades[0]["quantity"] > 2**31
+        assert portfolio["position"].iloc[-1] == trades[0]["quantity"]
+
+    def test_logged_amounts_use_thousands_separators(self, caplog, sample_data):
+        """Test that logged dollar amounts keep their grouping commas"""
+        engine = BacktestEngine(
+            MACDStrategy({}),
+            initial_capital=123456.0,
+            lot_size=10,
+            logger=logging.getLogger("test_backtest_engine"),
+        )
+        signals = pd.Series([0, 1, 1, 1, -1, 0])
+        with caplog.at_level(logging.INFO, logger="test_backtest_engine"):
+            engine._log_backtest_start(
+                sample_data.assign(time_key=pd.to_datetime(sample_data["time_key"])),
+                "HK.00001",
+            )
+            engine._simulate(sample_data, signals)
+
+        assert "Initial Capital: $123,456.00" in caplog.text
+        assert "(Cost: $123,123.00," in caplog.text
+        assert "Realized PnL: $18,185.55" in caplog.text
+
+    def test_large_capital_final_value_exact_to_the_cent(self, engine, sample_data):
+        """Test that cash and total keep cent precision for large capital"""
+        engine.initial_capital = 1e8 + 0.01
+        signals = pd.Series([0, 1, 0, 0, -1, 0])
+        portfolio, trades, _ = engine._simulate(sample_data, signals)
+
+        expected = engine.initial_capital - trades[0]["cost"] + trades[1]["proceeds"]
+        assert portfolio["total"].iloc[-1] == pytest.approx(expected, abs=1e-6)
+
+    def test_insufficient_cash_keeps_balance(self, engine, sample_data):
+        """Test that a buy signal without enough cash for one lot is skipped"""
+        engine.initial_capital = 500.0
+        signals = pd.Series([0, 1, 0, 0, 0, 0])
+        portfolio, trades, _ = engine._simulate(sample_data, signals)
+
+        assert (portfolio["position"] == 0).all()
+        assert (portfolio["cash"] == 500.0).all()
+        assert trades == []
+
+    def test_simulate_trades(self, engine, sample_data):
+        """Test that trades are emitted alongside the portfolio"""
+        signals = pd.Series([0, 1, 1, 1, -1, 0])
+        portfolio, trades, _ = engine._simulate(sample_data, signals)
+
+        assert [t["type"] for t in trades] == ["buy", "sell"]
+        buy, sell = trades
+        assert buy["timestamp"] == "2024-01-02 00:00:00"
+        assert buy["quantity"] == 90
+        assert buy["cost"] == pytest.approx(90 * 100.0 * 1.001)
+        assert sell["quantity"] == 90
+        assert sell["proceeds"] == pytest.approx(90 * 115.0 * 0.999)
+        assert sell["pnl"] == pytest.approx(sell["proceeds"] - buy["cost"])
+
+    def test_pnl_metrics(self, engine, sample_data):
+        """Test realized and floating PnL computed from the trade log"""
+        signals = pd.Series([0, 1, 0, -1, 1, 0])
+        portfolio, trades, trade_log = engine._simulate(sample_data, signals)
+
+        assert ReturnMetrics.calculate_realized_pnl(trade_log) == pytest.approx(
+            trades[1]["pnl"]
+        )
+        # The open position was bought at 115 and is marked at the last close
+        position = portfolio["position"].iloc[-1]
+        assert position > 0
+        assert ReturnMetrics.calculate_floating_pnl(
+            portfolio, trade_log
+        ) == pytest.approx((130.0 - 115.0) * position)
+
+    def test_run_multi_symbol_parallel_matches_serial(self, random_walk_data):
+        """Test that process-parallel multi-symbol runs match the serial path"""
+        data_dict = {
+            symbol: random_walk_data(seed, string_time_key=True)
+            for seed, symbol in enumerate(["HK.00001", "HK.00002"])
+        }
+
+        results = {}
+        for parallel in (False, True):
+            engine = BacktestEngine(
+                MACDStrategy({}),
+                initial_capital=10000.0,
+                lot_size=10,
+                parallel=parallel,
+            )
+            report = engine.run_multi_symbol(
+                data_dict, datetime(2023, 3, 1), datetime(2023, 7, 1)
+            )
+            results[parallel] = report.symbol_results
+
+        assert list(results[True]) == list(data_dict)
+        assert report.start_date == pd.Timestamp("2023-01-01")
+        assert report.end_date == pd.Timestamp("2023-07-19")
+        for symbol in data_dict:
+            serial, parallel = results[False][symbol], results[True][symbol]
+            pd.testing.assert_series_equal(serial.equity_curve, parallel.equity_curve)
+            assert serial.trades == parallel.trades
+
+    def test_run_multi_symbol_parallel_keeps_strategy_state(self, random_walk_data):
+        """Test that strategy attributes set after construction reach workers"""
+        data = random_walk_data(4)
+        data_dict = {"HK.00001": data, "HK.00002": data.copy()}
+
+        results = {}
+        for parallel in (False, True):
+            strategy = MovingAverageCrossStrategy({})
+            strategy.short_window, strategy.long_window = 3, 10
+            engine = BacktestEngine(
+                strategy, initial_capital=10000.0, parallel=parallel
+            )
+            report = engine.run_multi_symbol(
+                data_dict, datetime(2023, 3, 1), datetime(2023, 7, 1)
+            )
+            results[parallel] = report.symbol_results
+
+        for symbol in data_dict:
+            assert results[False][symbol].trades == results[True][symbol].trades
+
+    def test_run_multi_symbol_single_cpu_runs_serially(self, monkeypatch, engine):
+        """Test that no process pool is started when only one worker fits"""
+
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(backtest_engine.os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(backtest_engine, "ProcessPoolExecutor", no_pool)
+        data = pd.DataFrame(
+            {
+                "time_key": pd.date_range(start="2023-01-01", periods=120, freq="D"),
+                "close": np.linspace(50.0, 60.0, 120),
+            }
+        )
+
+        report = engine.run_multi_symbol(
+            {"HK.00001": data, "HK.00002": data.copy()},
+            datetime(2023, 3, 1),
+            datetime(2023, 4, 1),
+        )
+        assert list(report.symbol_results) == ["HK.00001", "HK.00002"]
+
+    def test_run_multi_symbol_lot_sizes(self, random_walk_data):
+        """Test that per-symbol lot sizes override the engine default"""
+        data = random_walk_data(1, string_time_key=True)
+        data_dict = {"HK.00001": data, "HK.00002": data.copy()}
+
+        for parallel in (False, True):
+            engine = BacktestEngine(
+                MACDStrategy({}), initial_capital=10000.0, parallel=parallel
+            )
+            report = engine.run_multi_symbol(
+                data_dict,
+                datetime(2023, 3, 1),
+                datetime(2023, 7, 1),
+                lot_sizes={"HK.00002": 100},
+            )
+
+            results = report.symbol_results
+            default_qty = [t["quantity"] for t in results["HK.00001"].trades]
+            override_qty = [t["quantity"] for t in results["HK.00002"].trades]
+            assert override_qty and all(q % 100 == 0 for q in override_qty)
+            assert any(q % 100 != 0 for q in default_qty)
+            assert engine.lot_size == 1
+
+    def test_symbol_results_float32_storage(self, engine, random_walk_data):
+        """Test the opt-in float32 storage of equity and benchmark values"""
+        data = random_walk_data(2, periods=120)
+        report = engine.run(
+            data, "HK.00001", datetime(2023, 2, 1), datetime(2023, 5, 1)
+        )
+
+        results = SymbolResults.from_backtest_report(report, dtype=np.float32)
+        assert results.equity_curve.dtype == np.float32
+        assert results.benchmark_data["value"].dtype == np.float32
+        np.testing.assert_allclose(
+            results.benchmark_data["value"], report.benchmark_data["value"], rtol=1e-6
+        )
+
+    def test_kernel_carries_position_between_trades(self):
+        """Test that position is held on every bar between trades"""
+        n = 1000
+        close = np.full(n, 10.0)
+        signals = np.zeros(n, dtype=np.int64)
+        signals[100] = 1
+        signals[600] = -1
+
+        position, cash, trade_idx, trade_type, _, _ = simulate(
+            close, signals, 1000.0, 0.0, 10
+        )
+
+        expected = np.zeros(n, dtype=np.int64)
+        expected[100:600] = 100
+        np.testing.assert_array_equal(position, expected)
+        np.testing.assert_array_equal(trade_idx, [100, 600])
+        np.testing.assert_array_equal(trade_type, [BUY, SELL])
+        assert (cash[100:600] == 0.0).all()
+        assert (cash[600:] == 1000.0).all()
+
+    def test_kernel_skips_nan_closes(self):
+        """Test that signals on missing bars do not trade or poison the cash"""
+        close = np.array([10.0, np.nan, 10.0, 12.0, np.nan, 12.0])
+        signals = np.array([0, 1, 1, 0, -1, -1])
+
+        position, cash, trade_idx, trade_type, _, _ = simulate(
+            close, signals, 1000.0, 0.0, 10
+        )
+
+        np.testing.assert_array_equal(trade_idx, [2, 5])
+        np.testing.assert_array_equal(trade_type, [BUY, SELL])
+        np.testing.assert_array_equal(position, [0, 0, 100, 100, 100, 0])
+        assert cash[-1] == pytest.approx(1200.0)
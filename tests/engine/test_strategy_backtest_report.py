@@ -0,0 +1,235 @@
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+from src.engine.backtest_engine import BacktestEngine
+from src.engine.symbol_results import SymbolResults
+from src.strategy.macd_strategy import MACDStrategy
+from src.engine.strategy_backtest_report import (
+    MAX_CHART_POINTS,
+    StrategyBacktestReport,
+    _downsample,
+    _epoch_ms,
+    _raw_value,
+)
+
+
+def _make_results(total_return, sharpe, drawdown, seed):
+    """Minimal stand-in for SymbolResults carrying formatted metrics"""
+    index = pd.date_range(start="2024-01-01", periods=60, freq="D")
+    rng = np.random.default_rng(seed)
+    equity = pd.Series(10000 * np.exp(np.cumsum(rng.normal(0, 0.01, 60))), index=index)
+    return SimpleNamespace(
+        equity_curve=equity,
+        metrics={
+            "Performance Metrics": [
+                {"title": "Final Portfolio Value", "value": "$1.00"},
+                {"title": "Total Return", "value": total_return},
+                {"title": "Annual Return", "value": "0.00%"},
+                {"title": "Sharpe Ratio", "value": sharpe},
+            ],
+            "Risk Metrics": [{"title": "Max Drawdown", "value": drawdown}],
+        },
+    )
+
+
+def _make_report(symbol_results):
+    return StrategyBacktestReport(
+        strategy_name="MACDStrategy",
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 3, 1),
+        initial_capital=10000.0,
+        commission_rate=0.001,
+        symbol_results=symbol_results,
+    )
+
+
+def test_portfolio_metrics_skip_unparsable_values():
+    report = _make_report(
+        {
+            "HK.00001": _make_results("10.00%", "1.50", "-5.00%", 0),
+            "HK.00002": _make_results("20.00%", "n/a", "-12.50%", 1),
+        }
+    )
+    metrics = report._calculate_portfolio_metrics()
+
+    assert metrics["total_return"] == pytest.approx(15.0)
+    assert metrics["sharpe_ratio"] == 1.5
+    assert metrics["max_drawdown"] == -12.5
+
+
+def test_portfolio_metrics_prefer_raw_values():
+    results = _make_results("10.00%", "1.50", "-5.00%", 0)
+    results.metrics["Performance Metrics"][1]["raw"] = 10.004
+    results.metrics["Risk Metrics"][0]["raw"] = -5.004
+    metrics = _make_report({"HK.00001": results})._calculate_portfolio_metrics()
+
+    assert metrics["total_return"] == pytest.approx(10.004)
+    assert metrics["sharpe_ratio"] == 1.5
+    assert metrics["max_drawdown"] == -5.004
+
+
+def test_portfolio_metrics_default_to_zero():
+    report = _make_report({"HK.00001": _make_results("n/a", "n/a", "n/a", 0)})
+    metrics = report._calculate_portfolio_metrics()
+
+    assert metrics["total_return"] == 0
+    assert metrics["sharpe_ratio"] == 0
+    assert metrics["max_drawdown"] == 0
+
+
+def test_downsample_short_series_unchanged():
+    series = pd.Series(np.arange(10.0))
+    assert _downsample(series, max_points=100) is series
+
+
+def test_downsample_keeps_endpoints():
+    index = pd.date_range(start="2024-01-01", periods=10_001, freq="min")
+    series = pd.Series(np.arange(10_001.0), index=index)
+    sampled = _downsample(series, max_points=4000)
+
+    assert len(sampled) <= 4001
+    assert sampled.index[0] == index[0]
+    assert sampled.index[-1] == index[-1]
+    assert sampled.index.is_monotonic_increasing
+
+
+def test_correlation_matrix_is_cached():
+    report = _make_report(
+        {
+            "HK.00001": _make_results("10.00%", "1.50", "-5.00%", 0),
+            "HK.00002": _make_results("20.00%", "1.00", "-12.50%", 1),
+        }
+    )
+    first = report._calculate_correlation_matrix()
+    assert report._calculate_correlation_matrix() is first
+    assert report._calculate_correlation_matrix(method="spearman") is not first
+    assert list(first.columns) == ["HK.00001", "HK.00002"]
+    assert first.loc["HK.00001", "HK.00001"] == pytest.approx(1.0)
+
+
+def test_correlation_matrix_matches_pandas():
+    symbol_results = {
+        f"HK.0000{i}": _make_results("1.00%", "1.00", "-1.00%", i) for i in range(4)
+    }
+    # A flat equity curve has undefined correlation, reported as 0
+    symbol_results["HK.00004"] = _make_results("0.00%", "0.00", "0.00%", 0)
+    symbol_results["HK.00004"].equity_curve[:] = 10000.0
+    report = _make_report(symbol_results)
+
+    equity = pd.DataFrame({s: r.equity_curve for s, r in symbol_results.items()})
+    log_returns = np.log(equity / equity.shift(1)).dropna()
+    expected = log_returns.corr(min_periods=30).fillna(0)
+
+    # Log returns are taken in float32, so allow for single-precision noise
+    pd.testing.assert_frame_equal(
+        report._calculate_correlation_matrix(), expected, check_exact=False, atol=1e-3
+    )
+
+
+def test_prepare_correlation_data_cells():
+    report = _make_report(
+        {f"HK.0000{i}": _make_results("1.00%", "1.00", "-1.00%", i) for i in range(3)}
+    )
+    corr = report._calculate_correlation_matrix()
+    data = report._prepare_correlation_data()
+
+    assert len(data) == 9
+    assert data[0] == [0, 0, 1.0]
+    assert data[5] == [1, 2, round(corr.iloc[1, 2], 2)]
+    assert all(isinstance(i, int) and isinstance(j, int) for i, j, _ in data)
+
+
+def test_trade_annotations():
+    report = _make_report({})
+    trades = [
+        {
+            "timestamp": "2024-01-02 00:00:00",
+            "type": "buy",
+            "price": 100,
+            "quantity": 90,
+        },
+        {
+            "timestamp": pd.Timestamp("2024-01-05"),
+            "type": "sell",
+            "price": 1150.5,
+            "quantity": 90,
+            "pnl": 12.0,
+        },
+    ]
+    buy, sell = report._prepare_symbol_trade_annotations(trades)
+
+    assert buy == {
+        "x": 1704153600000,
+        "y": 100.0,
+        "title": "↑",
+        "text": "BUY @ $100.00\nQty: 90",
+        "className": "trade-buy",
+    }
+    assert sell["x"] == 1704412800000
+    assert sell["text"] == "SELL @ $1,150.50\nQty: 90"
+    assert report._prepare_symbol_trade_annotations([]) == []
+
+
+def test_raw_value_parses_formatted_strings():
+    assert _raw_value({"value": "12.34%"}) == 12.34
+    assert _raw_value({"value": "$-1,234.50"}) == -1234.5
+    assert _raw_value({"value": "1.05"}) == 1.05
+    assert _raw_value({"value": "$0.00", "raw": 0.004}) == 0.004
+    with pytest.raises(ValueError):
+        _raw_value({"value": "n/a"})
+
+
+def test_correlation_matrix_single_symbol():
+    report = _make_report({"HK.00001": _make_results("1.00%", "1.00", "-1.00%", 0)})
+    corr = report._calculate_correlation_matrix()
+    assert corr.to_numpy().tolist() == [[1.0]]
+    assert list(corr.index) == list(corr.columns) == ["HK.00001"]
+    assert report._prepare_correlation_data() == [[0, 0, 1.0]]
+    assert _make_report({})._calculate_correlation_matrix().empty
+
+
+def test_rolling_correlation_matches_pandas():
+    report = _make_report(
+        {f"HK.0000{i}": _make_results("10.00%", "1.50", "-5.00%", i) for i in range(3)}
+    )
+    rolling = report.rolling_correlation(window=20)
+
+    expected = report._log_returns().astype(np.float64).rolling(20).corr()
+    pd.testing.assert_index_equal(rolling.index, expected.index)
+    np.testing.assert_allclose(rolling, expected, atol=1e-9)
+    # Diagonal of every complete window is exactly one
+    last = rolling.loc[rolling.index[-1][0]].to_numpy()
+    np.testing.assert_allclose(np.diag(last), 1.0)
+
+
+def test_benchmark_sampled_with_equity_positions():
+    # Warmup bars make the benchmark longer than the equity curve; place the
+    # two lengths on either side of the chart point limit
+    n = MAX_CHART_POINTS + 50
+    close = 50 * np.exp(np.cumsum(np.random.default_rng(3).normal(0, 0.01, n)))
+    data = pd.DataFrame(
+        {"time_key": pd.date_range(start="2015-01-01", periods=n), "close": close}
+    )
+    engine = BacktestEngine(MACDStrategy({}), initial_capital=10000.0, lot_size=10)
+    backtest = engine.run(
+        data, "HK.00001", datetime(2015, 3, 1), datetime(2026, 12, 31)
+    )
+    results = SymbolResults.from_backtest_report(backtest)
+    assert len(results.equity_curve) < MAX_CHART_POINTS < len(data)
+
+    entry = _make_report({"HK.00001": results})._build_symbol_entry("HK.00001", results)
+    equity, benchmark = entry["equity_curve"], entry["benchmark_curve"]
+    assert len(benchmark) == len(equity) == len(results.equity_curve)
+    assert [p[0] for p in benchmark] == [p[0] for p in equity]
+    np.testing.assert_allclose(
+        [p[1] for p in benchmark],
+        results.benchmark_data["value"].iloc[: len(equity)],
+    )
+
+
+@pytest.mark.parametrize("unit", ["s", "ms", "us", "ns"])
+def test_epoch_ms_any_resolution(unit):
+    index = pd.DatetimeIndex(["2024-01-01 00:00:00", "2024-01-02 12:00:00"])
+    assert _epoch_ms(index.as_unit(unit)).tolist() == [1704067200000, 1704196800000]
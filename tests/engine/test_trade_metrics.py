@@ -0,0 +1,62 @@
+import pytest
+import numpy as np
+import pandas as pd
+from src.engine.metrics.trade_metrics import TradeLog, TradeMetrics
+
+
+@pytest.fixture
+def trade_log():
+    """Closed trades with a known win/loss pattern"""
+    pnl = np.array([10.0, 5.0, -3.0, 7.0, 8.0, 9.0, -1.0, -2.0])
+    return TradeLog(
+        pnl=pnl,
+        ts=pd.date_range(start="2024-01-01", periods=len(pnl), freq="2D").to_numpy(),
+        side=np.full(len(pnl), -1, dtype=np.int8),
+        qty=np.full(len(pnl), 100, dtype=np.int64),
+        price=np.full(len(pnl), 10.0),
+    )
+
+
+def test_consecutive_stats(trade_log):
+    assert TradeMetrics.calculate_consecutive_stats(trade_log, "wins") == 3
+    assert TradeMetrics.calculate_consecutive_stats(trade_log, "losses") == 2
+
+
+def test_trade_counts_and_rates(trade_log):
+    counts = TradeMetrics.calculate_trade_counts(trade_log)
+    assert counts == {"total_trades": 8, "winning_trades": 5, "losing_trades": 3}
+    assert TradeMetrics.calculate_win_rate(trade_log) == pytest.approx(5 / 8)
+    assert TradeMetrics.calculate_profit_factor(trade_log) == pytest.approx(39 / 6)
+
+
+def test_position_duration(trade_log):
+    # Trades are paired (0, 1), (2, 3), ... two days apart
+    assert TradeMetrics.calculate_position_duration(trade_log) == pytest.approx(2.0)
+
+
+def test_closed_drops_entries():
+    log = TradeLog(
+        pnl=np.array([np.nan, 4.0]),
+        ts=pd.to_datetime(["2024-01-01", "2024-01-05"]).to_numpy(),
+        side=np.array([1, -1], dtype=np.int8),
+        qty=np.array([10, 10]),
+        price=np.array([1.0, 1.5]),
+    )
+    closed = log.closed()
+    assert len(closed) == 1
+    assert closed.pnl.tolist() == [4.0]
+    assert closed.side.tolist() == [-1]
+
+
+def test_empty_trade_log():
+    empty = TradeLog(
+        pnl=np.empty(0),
+        ts=np.empty(0, dtype="datetime64[ns]"),
+        side=np.empty(0, dtype=np.int8),
+        qty=np.empty(0, dtype=np.int64),
+        price=np.empty(0),
+    )
+    assert TradeMetrics.calculate_win_rate(empty) == 0.0
+    assert TradeMetrics.calculate_consecutive_stats(empty, "wins") == 0
+    assert TradeMetrics.calculate_position_duration(empty) == 0.0
+    assert TradeMetrics.calculate_trade_counts(empty)["total_trades"] == 0
@@ -68,6 +68,7 @@ class TestMACDStrategy:
 
         # Verify signals are valid
         assert isinstance(signals, pd.Series)
+        assert signals.dtype == np.int8
         assert signals.isin([-1, 0, 1]).all()
         assert len(signals) == len(sample_data)
 
@@ -150,3 +151,77 @@ class TestMACDStrategy:
 
         # In a falling market, we should see a sell signal
         assert -1 in signals.values
+
+    @pytest.fixture
+    def indicator_cache(self):
+        """Enable the prepare_data cache for one test"""
+        MACDStrategy.enable_indicator_cache()
+        yield
+        MACDStrategy.disable_indicator_cache()
+
+    def test_prepare_data_cache(self, sample_data, indicator_cache):
+        """Test that prepare_data reuses indicators only for identical inputs"""
+        strategy = MACDStrategy({"fast_period": 12, "slow_period": 26})
+        data = sample_data.assign(time_key=sample_data["timestamp"])
+        start = data["time_key"].iloc[40]
+
+        first = strategy.prepare_data(data, start_date=start)
+        calls = []
+        strategy.calculate_indicators = lambda d: calls.append(d) or d
+        second = strategy.prepare_data(data, start_date=start)
+
+        assert calls == []
+        pd.testing.assert_frame_equal(first[1], second[1])
+
+        # Cache hits are copied out, so mutating a result is harmless
+        second[1].loc[0, "MACD"] = np.nan
+        third = strategy.prepare_data(data, start_date=start)
+        pd.testing.assert_frame_equal(first[1], third[1])
+
+        # Changed data or parameters miss the cache
+        strategy.prepare_data(data.assign(close=data["close"] + 1), start_date=start)
+        assert len(calls) == 1
+        other = MACDStrategy({"fast_period": 5, "slow_period": 26})
+        assert not np.allclose(
+            other.prepare_data(data, start_date=start)[1]["MACD"], first[1]["MACD"]
+        )
+
+    def test_prepare_data_cache_tracks_attributes(self, sample_data, indicator_cache):
+        """Test that attributes changed after construction miss the cache"""
+        strategy = MACDStrategy({})
+        data = sample_data.assign(time_key=sample_data["timestamp"])
+        default = strategy.prepare_data(data)[0]["MACD"]
+
+        strategy.fast_period = 5
+        swept = strategy.prepare_data(data)[0]["MACD"]
+        expected = MACDStrategy({"fast_period": 5}).calculate_indicators(data)["MACD"]
+        np.testing.assert_allclose(swept, expected)
+        assert not np.allclose(swept, default)
+
+        # A same-named class from elsewhere does not share entries
+        Other = type("MACDStrategy", (MACDStrategy,), {})
+        Other({}).prepare_data(data)
+        assert len(MACDStrategy._indicator_cache) == 3
+
+    def test_prepare_data_cache_opt_in(self, sample_data):
+        """Test that prepare_data does not cache unless enabled"""
+        strategy = MACDStrategy({})
+        data = sample_data.assign(time_key=sample_data["timestamp"])
+        strategy.prepare_data(data)
+
+        assert len(MACDStrategy._indicator_cache) == 0
+
+    def test_prepare_data_cache_byte_budget(self, sample_data, indicator_cache):
+        """Test that the oldest entries are evicted once over the byte budget"""
+        strategy = MACDStrategy({})
+        data = sample_data.assign(time_key=sample_data["timestamp"])
+        nbytes = 2 * int(
+            strategy.calculate_indicators(data).memory_usage(deep=True).sum()
+        )
+
+        MACDStrategy.enable_indicator_cache(max_bytes=int(2.5 * nbytes))
+        for shift in range(4):
+            strategy.prepare_data(data.assign(close=data["close"] + shift))
+
+        assert len(MACDStrategy._indicator_cache) == 2
+        assert MACDStrategy._indicator_cache_nbytes <= 2.5 * nbytes
@@ -1,7 +1,11 @@
 import pytest
 import numpy as np
 import pandas as pd
-from src.strategy.moving_average_strategy import MovingAverageCrossStrategy
+from src.strategy.moving_average_strategy import (
+    MovingAverageCrossStrategy,
+    _moving_averages,
+    _rolling_mean,
+)
 
 
 class TestMovingAverageCrossStrategy:
@@ -137,3 +141,64 @@ class TestMovingAverageCrossStrategy:
 
         # In a falling market, we should see a sell signal
         assert -1 in signals.values
+
+    def test_rolling_mean_matches_pandas(self):
+        """Test the prefix-sum SMA against pandas rolling means"""
+        close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 5000))
+        for window in (1, 3, 20, 50):
+            expected = pd.Series(close).rolling(window, min_periods=1).mean()
+            np.testing.assert_allclose(
+                _rolling_mean(close, window), expected, rtol=1e-9
+            )
+
+        # Missing closes are skipped; a window with no valid close is NaN
+        gaps = np.array([np.nan, 1.0, 2.0, 3.0, np.nan, 5.0, np.nan, np.nan, 8.0])
+        for window in (1, 2, 3):
+            expected = pd.Series(gaps).rolling(window, min_periods=1).mean()
+            np.testing.assert_allclose(_rolling_mean(gaps, window), expected, rtol=1e-9)
+        assert np.isnan(_rolling_mean(np.full(3, np.nan), 2)).all()
+
+    def test_fused_moving_averages_match_pandas(self):
+        """Test the single-pass SMA kernel against pandas rolling means"""
+        close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 5000))
+        sma_short, sma_long = _moving_averages(close, 5, 30)
+
+        for sma, window in ((sma_short, 5), (sma_long, 30)):
+            expected = pd.Series(close).rolling(window, min_periods=1).mean()
+            np.testing.assert_allclose(sma, expected, rtol=1e-9)
+
+        # Missing closes are skipped; a window with no valid close is NaN
+        gaps = np.array([np.nan, 1.0, 2.0, 3.0, np.nan, 5.0, np.nan, np.nan, 8.0])
+        sma_short, sma_long = _moving_averages(gaps, 2, 3)
+        for sma, window in ((sma_short, 2), (sma_long, 3)):
+            expected = pd.Series(gaps).rolling(window, min_periods=1).mean()
+            np.testing.assert_allclose(sma, expected, rtol=1e-9)
+
+        empty_short, empty_long = _moving_averages(np.empty(0), 5, 30)
+        assert len(empty_short) == len(empty_long) == 0
+
+    def test_indicators_share_input_columns(self, strategy, sample_data):
+        """Test that indicators are attached without copying the input"""
+        data = strategy.calculate_indicators(sample_data)
+
+        assert list(data.columns) == ["close", "timestamp", "SMA_short", "SMA_long"]
+        assert "SMA_short" not in sample_data.columns
+        assert np.shares_memory(data["close"].to_numpy(), sample_data["close"])
+        assert strategy.generate_signals(data).dtype == np.int8
+
+    def test_prepare_data_shares_input_columns(self, strategy, sample_data):
+        """Test that the warmup frame keeps sharing the input's columns"""
+        data = sample_data.assign(time_key=sample_data["timestamp"])
+        calculated, _ = strategy.prepare_data(data, start_date=data["time_key"][60])
+
+        assert isinstance(calculated.index, pd.DatetimeIndex)
+        assert calculated.index.name == "time_key"
+        assert np.shares_memory(calculated["close"].to_numpy(), data["close"])
+        np.testing.assert_array_equal(calculated["close"], data["close"])
+
+    def test_undefined_spread_holds(self, strategy):
+        """Test that a NaN moving average produces a hold signal"""
+        data = pd.DataFrame(
+            {"SMA_short": [1.0, 2.0, np.nan, 3.0], "SMA_long": [2.0, 2.0, 1.0, 1.0]}
+        )
+        assert strategy.generate_signals(data).tolist() == [-1, 0, 0, 1]
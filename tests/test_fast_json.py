@@ -0,0 +1,21 @@
+import json
+import pytest
+import numpy as np
+from src.utils.fast_json import dumps, ORJSON_AVAILABLE
+
+
+def test_dumps_matches_stdlib_semantics():
+    data = {"b": [[1704067200000, 1.5], [1704153600000, -0.25]], "a": "↑ BUY"}
+    assert json.loads(dumps(data, sort_keys=True)) == data
+    encoded = dumps(data, sort_keys=True)
+    assert encoded.index('"a"') < encoded.index('"b"')
+
+
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson not installed")
+def test_dumps_numpy_values():
+    data = {"value": np.float64(0.5), "count": np.int64(3), "series": np.arange(3)}
+    assert json.loads(dumps(data)) == {"value": 0.5, "count": 3, "series": [0, 1, 2]}
+
+
+def test_dumps_falls_back_to_stdlib_kwargs():
+    assert dumps({"a": 1}, indent=2) == json.dumps({"a": 1}, indent=2)